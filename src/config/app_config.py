@@ -1,25 +1,69 @@
 # config/app_config.py
+import atexit
+import functools
 import json
+import logging
 import os
+import threading
+
+try:
+    import orjson  # C parser/serializer, much faster than the stdlib on startup
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config) -> bytes:
+    # Always the stdlib: orjson can only indent by 2 (and writes non-ASCII unescaped), so
+    # config.json would be reformatted depending on whether it is installed. Saves are rare.
+    return json.dumps(config, indent=4).encode('utf-8')
+
+
+_MISSING = object()
+_CWD = os.getcwd()  # resolved once; default paths are rebuilt whenever the config is reset
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_get(key):
+    """Memoized lookup for hot settings; cleared whenever the config changes."""
+    return AppConfig._config.get(key, _MISSING)
+
 
 class AppConfig:
     _config = {}
     _config_path = "config.json" # This file will be created in your root folder
+    _loaded_mtime_ns = None   # mtime of config.json when it was last parsed
+    _dirty = False            # in-memory settings not yet written to disk
+    _flush_timer = None
+    _flush_delay = 0.5        # seconds; bursts of set_setting calls share one write
+    _lock = threading.RLock()
 
     @staticmethod
     def load_config():
         """
         Loads configuration from a JSON file.
         If the file doesn't exist, it creates one with default values.
+        The parsed file is cached and only re-read when its mtime changes.
         """
-        if os.path.exists(AppConfig._config_path):
-            try:
-                with open(AppConfig._config_path, 'r') as f:
-                    AppConfig._config = json.load(f)
-            except json.JSONDecodeError:
-                print("Warning: config.json is corrupted. Loading defaults.")
-                AppConfig._create_default_config()
-        else:
+        try:
+            with open(AppConfig._config_path, 'rb') as f:
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                if mtime_ns == AppConfig._loaded_mtime_ns:
+                    return
+                AppConfig._config = _loads(f.read())
+            AppConfig._loaded_mtime_ns = mtime_ns
+            _cached_get.cache_clear()
+        except FileNotFoundError:
+            AppConfig._create_default_config()
+        except ValueError:  # json/orjson JSONDecodeError, or undecodable bytes
+            logger.warning("config.json is corrupted. Loading defaults.")
             AppConfig._create_default_config()
 
     @staticmethod
@@ -27,25 +71,53 @@ class AppConfig:
         """Sets up the default configuration and saves it."""
         AppConfig._config = {
             "theme": "light",
-            "backup_path": os.path.join(os.getcwd(), "backups"),
+            "backup_path": os.path.join(_CWD, "backups"),
             "auto_backup": False,
             "email_notifications": True
         }
+        _cached_get.cache_clear()
         AppConfig.save_config()
 
     @staticmethod
     def save_config():
-        """Saves the current configuration to the JSON file."""
-        with open(AppConfig._config_path, 'w') as f:
-            json.dump(AppConfig._config, f, indent=4)
+        """Saves the current configuration to the JSON file immediately."""
+        with AppConfig._lock:
+            if AppConfig._flush_timer is not None:
+                AppConfig._flush_timer.cancel()
+                AppConfig._flush_timer = None
+            # Write to a temp file and swap it in so a crash never leaves a half-written config.
+            tmp_path = f"{AppConfig._config_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(AppConfig._config))
+            os.replace(tmp_path, AppConfig._config_path)
+            AppConfig._loaded_mtime_ns = os.stat(AppConfig._config_path).st_mtime_ns
+            AppConfig._dirty = False
+
+    @staticmethod
+    def _flush():
+        """Writes pending setting changes, if any."""
+        with AppConfig._lock:
+            if AppConfig._dirty:
+                AppConfig.save_config()
 
     @staticmethod
     def get_setting(key, default=None):
         """Gets a specific setting by key."""
-        return AppConfig._config.get(key, default)
+        value = _cached_get(key)
+        return default if value is _MISSING else value
 
     @staticmethod
     def set_setting(key, value):
-        """Sets a specific setting and saves the config."""
-        AppConfig._config[key] = value
-        AppConfig.save_config()
+        """Sets a specific setting and schedules a (coalesced) save."""
+        with AppConfig._lock:
+            AppConfig._config[key] = value
+            _cached_get.cache_clear()
+            AppConfig._dirty = True
+            if AppConfig._flush_timer is None:
+                AppConfig._flush_timer = threading.Timer(AppConfig._flush_delay, AppConfig._flush)
+                AppConfig._flush_timer.daemon = True
+                AppConfig._flush_timer.start()
+
+
+# Make sure debounced changes still reach disk when the app exits.
+atexit.register(AppConfig._flush)
@@ -1,31 +1,53 @@
 # main.py
 import sys
 import os
+import logging
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFontDatabase
 from ui.main_window import MainWindow
+from ui.icon_manager import IconManager
+
+logger = logging.getLogger(__name__)
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS; resolved once at import
+_BASE = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE, relative_path)
+
+# Icons painted while the main window is built (sidebar and page headers).
+STARTUP_ICONS = ["dashboard", "switches", "scheduler", "logs", "add", "delete", "refresh", "back_arrow"]
+
+def load_app_font(font_path):
+    """Registers the bundled font and returns its family name, or None on failure."""
+    font_id = QFontDatabase.addApplicationFont(font_path)
+    if font_id == -1:
+        return None
+    return QFontDatabase.applicationFontFamilies(font_id)[0]
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("NMSIMPLE_LOGLEVEL", "WARNING").upper())
+
+    # Background workers (ping sweeps, SNMP) each run their own asyncio loop;
+    # use uvloop's faster reactor for them where it is installed (not on Windows).
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     app = QApplication(sys.argv)
+    IconManager.prewarm(STARTUP_ICONS)
     
     # Updated font loading for PyInstaller compatibility
     font_path = resource_path("resources/fonts/Roboto-Regular.ttf")
-    font_id = QFontDatabase.addApplicationFont(font_path)
+    font_family = load_app_font(font_path)
     
-    if font_id != -1:
-        font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-        print(f"Successfully loaded font: {font_family}")
+    if font_family:
+        logger.info("Successfully loaded font: %s", font_family)
     else:
-        print(f"Warning: Could not load font from {font_path}. Using system default.")
+        logger.warning("Could not load font from %s. Using system default.", font_path)
     
     window = MainWindow()
     window.show()
@@ -0,0 +1,57 @@
+# network/bulk_ping.py
+# Description: Pings a whole list of hosts in one go. Uses fping when it is installed,
+# so a sweep costs one process instead of one `ping` process per device.
+
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from network.ping_worker import ping_ip
+
+logger = logging.getLogger(__name__)
+
+FPING_PATH = shutil.which("fping")  # resolved once at import
+FPING_TIMEOUT_MS = 500
+
+
+def _fping(ips: List[str], timeout_ms: int) -> Dict[str, bool]:
+    """Runs a single fping over every address; fping prints the reachable ones on stdout."""
+    result = {ip: False for ip in ips}
+    try:
+        completed = subprocess.run(
+            [FPING_PATH, "-a", "-q", "-t", str(timeout_ms), "-r", "0", *ips],
+            capture_output=True,
+            text=True,
+            timeout=max(3, len(ips) * 0.05)  # overall timeout
+        )
+    except subprocess.TimeoutExpired as e:
+        logger.warning("fping timed out after %s s.", e.timeout)
+        return result
+
+    # The exit code is non-zero whenever any host is down, so only stdout matters.
+    for line in completed.stdout.splitlines():
+        ip = line.strip()
+        if ip in result:
+            result[ip] = True
+    if completed.stderr and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("fping stderr:\n%s", completed.stderr)
+    return result
+
+
+def bulk_ping(ips: List[str], timeout_ms: int = FPING_TIMEOUT_MS) -> Dict[str, bool]:
+    """
+    Pings every address in `ips` and returns {ip: reachable}.
+    Falls back to concurrent per-host pings when fping is not installed.
+    """
+    ips = [ip for ip in dict.fromkeys(ips) if ip]
+    if not ips:
+        return {}
+    if FPING_PATH:
+        return _fping(ips, timeout_ms)
+
+    workers = min(64, (os.cpu_count() or 1) * 8, len(ips))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(ips, executor.map(ping_ip, ips)))
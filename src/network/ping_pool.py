@@ -0,0 +1,225 @@
+# network/ping_pool.py
+# Description: Pings many devices concurrently from a single asyncio event loop,
+# so a status sweep costs roughly one round-trip instead of one thread per device.
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, QTimer, Signal
+
+from network.bulk_ping import bulk_ping, FPING_PATH
+from network.ping_worker import get_pinger, is_ipv6, ping_command, PING_TIMEOUT, TCP_PROBE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_PINGS = 256  # keeps a large sweep from flooding the network in one burst
+
+
+async def _ping_icmp(pinger, ip: str, timeout: float) -> bool:
+    """Sends one echo request through the shared ICMP socket and awaits its reply."""
+    loop = asyncio.get_running_loop()
+    replied = loop.create_future()
+
+    def _on_reply():
+        # Replies may be drained from another thread that is pinging through the same socket.
+        loop.call_soon_threadsafe(lambda: replied.done() or replied.set_result(True))
+
+    key = pinger.send(ip, _on_reply)
+    try:
+        return await asyncio.wait_for(replied, timeout)
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        pinger.cancel(key)
+
+
+async def _probe_tcp(ip: str, port: int, timeout: float = TCP_PROBE_TIMEOUT) -> bool:
+    """Fast path: a TCP connect that is accepted or refused proves the host is up."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, int(port)), timeout)
+    except ConnectionRefusedError:
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def _ping_command(ip: str, timeout: float) -> bool:
+    """Fallback: runs the system ping binary as an asyncio subprocess."""
+    proc = await asyncio.create_subprocess_exec(
+        *ping_command(ip),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout + 1) == 0  # 6 s with the default timeout
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+    except asyncio.CancelledError:
+        # The sweep was stopped: don't leave the ping process running behind us.
+        proc.kill()
+        await proc.wait()
+        raise
+
+
+async def ping_many(
+    devices: List[Dict[str, Any]],
+    on_result: Optional[Callable[[int, str], None]] = None,
+    timeout: float = PING_TIMEOUT,
+    cancel: Optional[asyncio.Event] = None,
+) -> List[Tuple[int, str]]:
+    """
+    Pings every device concurrently and returns a list of (device_id, status).
+    `on_result` is called as each individual ping resolves.
+    Once `cancel` is set, devices that have not started yet are skipped and left out of the result.
+    """
+    loop = asyncio.get_running_loop()
+    pinger = get_pinger()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PINGS)
+
+    async def _ping_one(device):
+        ip = device.get('ip')
+        device_id = device.get('id', -1)
+        async with semaphore:
+            if cancel is not None and cancel.is_set():
+                return None
+            try:
+                probe_port = device.get('probe_port')
+                if probe_port and await _probe_tcp(ip, probe_port):
+                    online = True
+                elif fping_alive is not None:
+                    online = fping_alive.get(ip, False)
+                elif pinger is None or is_ipv6(ip):
+                    # The shared ICMP socket is IPv4-only
+                    online = await _ping_command(ip, timeout)
+                elif watching_socket:
+                    online = await _ping_icmp(pinger, ip, timeout)
+                else:
+                    online = await loop.run_in_executor(None, pinger.ping, ip, timeout)
+            except Exception as e:
+                logger.error("Error pinging %s: %s", ip, e)
+                online = False
+
+        status = "Online" if online else "Offline"
+        if online:
+            logger.info("Ping to %s successful.", ip)
+        else:
+            logger.warning("Ping to %s failed.", ip)
+        if on_result:
+            on_result(device_id, status)
+        return device_id, status
+
+    fping_alive = None
+    if pinger is None and FPING_PATH:
+        # No ICMP socket: one fping process for the whole sweep beats a ping process per device.
+        fping_alive = await loop.run_in_executor(None, bulk_ping, [d.get('ip') for d in devices])
+
+    watching_socket = False
+    if pinger is not None:
+        try:
+            loop.add_reader(pinger.fileno(), pinger.drain)
+            watching_socket = True
+        except NotImplementedError:
+            # Proactor loops (Windows) cannot watch raw sockets; use blocking pings on the executor.
+            pass
+    try:
+        results = await asyncio.gather(*(_ping_one(d) for d in devices))
+        return [r for r in results if r is not None]
+    finally:
+        if watching_socket:
+            loop.remove_reader(pinger.fileno())
+
+
+class PingBatcher(QObject):
+    """
+    Collects ping results pushed from worker threads and hands them to the GUI
+    thread in batches, so a sweep costs one queued dispatch and one table update
+    per flush interval instead of one per device.
+    Create it on the GUI thread; `push` may be called from any thread.
+    """
+
+    batch_ready = Signal(list)  # [(device_id, status), ...]
+
+    def __init__(self, flush_interval: int = 250, parent=None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._pending = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(flush_interval)
+        self._timer.timeout.connect(self.flush)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        """Stops the flush timer and delivers anything still pending."""
+        self._timer.stop()
+        self.flush()
+
+    def push(self, device_id: int, status: str):
+        with QMutexLocker(self._mutex):
+            self._pending.append((device_id, status))
+
+    def flush(self):
+        with QMutexLocker(self._mutex):
+            batch, self._pending = self._pending, []
+        if batch:
+            self.batch_ready.emit(batch)
+
+
+class PingPoolWorker(QObject):
+    """
+    Qt worker that runs one `ping_many` sweep on its own event loop.
+    A single instance replaces the old one-QThread-per-device PingWorker fan-out.
+    """
+
+    finished = Signal()
+    result_ready = Signal(int, str)  # device_id, status ("Online"/"Offline")
+
+    def __init__(self, devices: List[Dict[str, Any]], batcher: Optional[PingBatcher] = None):
+        super().__init__()
+        self.devices = devices
+        self.batcher = batcher
+        self._loop = None
+        self._task = None
+        self._cancel = None  # CancellationToken: set by stop() so queued pings are skipped
+
+    def run(self):
+        """
+        Called when the thread starts. Pings all devices and reports each result as it
+        arrives, through the batcher when one is set, otherwise via result_ready.
+        """
+        on_result = self.batcher.push if self.batcher else self.result_ready.emit
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._cancel = asyncio.Event()
+        self._task = loop.create_task(ping_many(self.devices, on_result, cancel=self._cancel))
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            logger.info("Ping sweep stopped.")
+        except Exception as e:
+            logger.error("Ping sweep failed: %s", e)
+        finally:
+            self._loop = None
+            loop.close()
+            self.finished.emit()
+
+    def stop(self):
+        """Aborts the sweep from any thread: pending pings are skipped, in-flight ones cancelled."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._abort)
+        except RuntimeError:
+            pass  # the loop already finished and closed
+
+    def _abort(self):
+        self._cancel.set()
+        self._task.cancel()
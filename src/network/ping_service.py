@@ -0,0 +1,149 @@
+# network/ping_service.py
+# Description: A long-lived ping thread. One select() loop over the shared ICMP socket
+# keeps any number of pings in flight, instead of one short-lived worker per ping.
+
+import heapq
+import itertools
+import logging
+import queue
+import select
+import socket
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+from network.ping_worker import get_pinger, is_ipv6, PingTask, ping_thread_pool, PING_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class PingService(QThread):
+    """
+    Persistent ping service. Call `submit(device_id, ip, probe_port)` from any thread; the
+    result arrives on `result_ready` as soon as the echo reply comes in, or as "Offline"
+    once the timeout passes; pings still pending when the loop exits are reported
+    "Offline" too. The main window creates and starts one when it opens.
+    """
+
+    result_ready = Signal(int, str)  # device_id, status ("Online"/"Offline")
+
+    def __init__(self, timeout: float = PING_TIMEOUT, parent=None):
+        super().__init__(parent)
+        self.timeout = timeout
+        self._requests = queue.SimpleQueue()
+        self._tokens = itertools.count()
+        self._inflight = {}                    # token -> device_id
+        self._inflight_lock = threading.Lock()
+        self._stopping = False
+        # Writing a byte to the pair wakes select() when a request is submitted.
+        # A socketpair rather than os.pipe() so select() also works on Windows.
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+
+    def submit(self, device_id: int, ip: str, probe_port=None):
+        """Queues a ping of `ip`; its result is reported for `device_id`."""
+        if probe_port or get_pinger() is None or not self.isRunning() or is_ipv6(ip):
+            # A TCP probe would block the select() loop, and without an ICMP socket, a running
+            # service or an IPv4 address there is nothing to send here: ping on the pool instead.
+            task = PingTask({'id': device_id, 'ip': ip, 'probe_port': probe_port})
+            task.signals.result_ready.connect(self.result_ready)
+            ping_thread_pool().start(task)
+            return
+        self._requests.put((device_id, ip))
+        self._wake()
+
+    def stop(self):
+        """Stops the loop and waits for the thread to exit."""
+        self._stopping = True
+        self._wake()
+        self.wait()
+
+    def _wake(self):
+        try:
+            self._wakeup_w.send(b'\x00')
+        except OSError:
+            pass  # buffer full: select() is already due to wake
+
+    def run(self):
+        pinger = get_pinger()
+        if pinger is None:
+            return
+        deadlines = []  # heap of (deadline, token, key)
+        try:
+            self._loop(pinger, deadlines)
+        finally:
+            self._fail_pending(pinger, deadlines)
+
+    def _loop(self, pinger, deadlines):
+        while not self._stopping:
+            wait = max(0.0, deadlines[0][0] - time.monotonic()) if deadlines else None
+            try:
+                readable, _, _ = select.select([pinger.fileno(), self._wakeup_r], [], [], wait)
+            except OSError as e:
+                logger.error("Ping service select failed: %s", e)
+                break
+
+            if self._wakeup_r in readable:
+                try:
+                    while self._wakeup_r.recv(4096):
+                        pass
+                except (BlockingIOError, InterruptedError):
+                    pass
+            if pinger.fileno() in readable:
+                pinger.drain()
+
+            while True:
+                try:
+                    device_id, ip = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                self._send(pinger, device_id, ip, deadlines)
+
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                _, token, key = heapq.heappop(deadlines)
+                pinger.cancel(key)
+                with self._inflight_lock:
+                    device_id = self._inflight.pop(token, None)
+                if device_id is not None:
+                    logger.warning("Ping to device %s timed out.", device_id)
+                    self.result_ready.emit(device_id, "Offline")
+
+    def _fail_pending(self, pinger, deadlines):
+        """Reports every in-flight and still-queued ping as "Offline", so no caller waits forever."""
+        for _, _, key in deadlines:
+            pinger.cancel(key)
+        with self._inflight_lock:
+            device_ids = list(self._inflight.values())
+            self._inflight.clear()
+        while True:
+            try:
+                device_ids.append(self._requests.get_nowait()[0])
+            except queue.Empty:
+                break
+        for device_id in device_ids:
+            self.result_ready.emit(device_id, "Offline")
+
+    def _send(self, pinger, device_id, ip, deadlines):
+        token = next(self._tokens)
+        with self._inflight_lock:
+            self._inflight[token] = device_id
+
+        def _on_reply():
+            # May run on another thread that drains the shared socket.
+            with self._inflight_lock:
+                replied_id = self._inflight.pop(token, None)
+            if replied_id is not None:
+                self.result_ready.emit(replied_id, "Online")
+
+        try:
+            key = pinger.send(ip, _on_reply)
+        except OSError as e:
+            logger.error("Error pinging %s: %s", ip, e)
+            with self._inflight_lock:
+                self._inflight.pop(token, None)
+            self.result_ready.emit(device_id, "Offline")
+            return
+        heapq.heappush(deadlines, (time.monotonic() + self.timeout, token, key))
@@ -1,78 +1,318 @@
 # File: network/ping_worker.py
 
+import errno
+import ipaddress
+import itertools
+import os
 import platform
+import select
+import socket
+import struct
 import subprocess
+import threading
+import time
 import logging
+from functools import lru_cache
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from config.app_config import AppConfig
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+PING_TIMEOUT = 5  # seconds
+TCP_PROBE_TIMEOUT = 0.3  # seconds; a live host answers a SYN far sooner than an ICMP timeout
+
+# Resolved once at import: the platform never changes while the app runs.
+IS_WINDOWS = platform.system().lower().startswith("win")
+# On Unix, -n keeps ping from reverse-resolving the replying address.
+PING_PREFIX = ["ping", "-n", "1", "-w", "5000"] if IS_WINDOWS else ["ping", "-n", "-c", "1", "-W", "5"]
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Standard internet checksum (RFC 1071) over an ICMP packet."""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
 
-class PingWorker(QObject):
+def _build_echo_request(ident: int, seq: int) -> bytes:
+    """Builds an 8-byte ICMP echo header plus a small timestamp payload."""
+    payload = struct.pack("!d", time.monotonic())
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + payload)
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, ident, seq)
+    return header + payload
+
+
+class IcmpPinger:
     """
-    A Qt-compatible worker class used to ping a device in a separate thread.
-    This structure allows integration with PySide6 for GUI applications.
+    A single ICMP socket shared by every ping in the process.
+
+    Uses an unprivileged SOCK_DGRAM ICMP socket where the OS allows it
+    (Linux ping_group_range, macOS) and falls back to SOCK_RAW. Replies are
+    routed to the waiting caller by their (ident, seq) pair, so any number of
+    worker threads can ping through the same socket concurrently.
     """
 
-    # Qt signals
+    def __init__(self):
+        self._sock, self._raw = self._open_socket()
+        self._sock.setblocking(False)
+        self._ident = os.getpid() & 0xFFFF
+        self._seq = itertools.count(1)
+        self._pending = {}                    # (ident, seq) -> callback
+        self._pending_lock = threading.Lock()
+        self._recv_lock = threading.Lock()    # only one thread drains the socket at a time
+
+    @staticmethod
+    def _open_socket():
+        try:
+            return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+        except OSError:
+            return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    def send(self, ip, callback):
+        """Sends one echo request and registers `callback` for its reply. Returns the routing key."""
+        seq = next(self._seq) & 0xFFFF
+        key = (self._ident, seq)
+        with self._pending_lock:
+            self._pending[key] = callback
+        try:
+            self._sock.sendto(_build_echo_request(self._ident, seq), (ip, 0))
+        except OSError:
+            self.cancel(key)
+            raise
+        return key
+
+    def cancel(self, key):
+        with self._pending_lock:
+            self._pending.pop(key, None)
+
+    def drain(self):
+        """Reads every queued reply and fires the matching callbacks."""
+        while True:
+            try:
+                data, _ = self._sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.debug("ICMP receive error: %s", e)
+                return
+
+            # Raw sockets, and datagram sockets on macOS, deliver the IPv4 header too;
+            # an ICMP message never starts with 0x4_, so the version nibble tells them apart.
+            if data and data[0] >> 4 == 4:
+                data = data[(data[0] & 0x0F) * 4:]  # strip the IPv4 header
+            if len(data) < 8:
+                continue
+
+            icmp_type, _, _, ident, seq = struct.unpack("!BBHHH", data[:8])
+            if icmp_type != ICMP_ECHO_REPLY:
+                continue
+            # Datagram ICMP sockets have their ident rewritten by the kernel,
+            # which already filters replies to this socket, so only seq matters.
+            key = (ident if self._raw else self._ident, seq)
+            with self._pending_lock:
+                callback = self._pending.pop(key, None)
+            if callback:
+                callback()
+
+    def ping(self, ip, timeout=PING_TIMEOUT) -> bool:
+        """Blocking ping of a single host. Returns True when an echo reply arrives in time."""
+        replied = threading.Event()
+        key = self.send(ip, replied.set)
+        deadline = time.monotonic() + timeout
+        try:
+            while not replied.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if self._recv_lock.acquire(blocking=False):
+                    try:
+                        readable, _, _ = select.select([self._sock], [], [], min(remaining, 0.05))
+                        if readable:
+                            self.drain()
+                    finally:
+                        self._recv_lock.release()
+                else:
+                    replied.wait(min(remaining, 0.05))
+            return True
+        finally:
+            self.cancel(key)
+
+
+_pinger = None
+_pinger_lock = threading.Lock()
+_pinger_unavailable = False
+
+
+def get_pinger():
+    """Returns the shared IcmpPinger, or None if ICMP sockets are not permitted here."""
+    global _pinger, _pinger_unavailable
+    if _pinger is None and not _pinger_unavailable:
+        with _pinger_lock:
+            if _pinger is None and not _pinger_unavailable:
+                try:
+                    _pinger = IcmpPinger()
+                except OSError as e:
+                    logger.info("ICMP socket unavailable (%s); falling back to the system ping command.", e)
+                    _pinger_unavailable = True
+    return _pinger
+
+
+@lru_cache(maxsize=1024)
+def is_ipv6(ip) -> bool:
+    """True for an IPv6 literal. The shared ICMP socket is IPv4-only, so those use the ping command."""
+    try:
+        return ipaddress.ip_address(ip).version == 6
+    except ValueError:
+        return False
+
+
+def ping_command(ip) -> list:
+    """
+    Builds the system ping command line for `ip`.
+    On Windows an IP literal gets -4/-6 so ping skips address-family probing;
+    hostnames are passed through unchanged since devices may be added by name.
+    """
+    if not ip:
+        raise ValueError("No IP address to ping.")
+    if IS_WINDOWS:
+        try:
+            family = "-6" if ipaddress.ip_address(ip).version == 6 else "-4"
+        except ValueError:
+            return PING_PREFIX + [ip]
+        return PING_PREFIX + [family, ip]
+    return PING_PREFIX + [ip]
+
+
+def _ping_with_command(ip) -> bool:
+    """Fallback when no ICMP socket can be opened: shell out to the system ping."""
+    command = ping_command(ip)
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        # Only the exit code matters: let the kernel discard the output instead of
+        # piping and decoding it.
+        result = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=PING_TIMEOUT + 1  # overall timeout
+        )
+        return result.returncode == 0
+
+    logger.debug("Pinging %s with command: %s", ip, ' '.join(command))
+    result = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=PING_TIMEOUT + 1  # overall timeout
+    )
+
+    logger.debug("Ping result for %s:\nSTDOUT:\n%s\nSTDERR:\n%s", ip, result.stdout, result.stderr)
+    return result.returncode == 0
+
+
+def tcp_probe(ip, port, timeout=TCP_PROBE_TIMEOUT) -> bool:
+    """
+    Tries a TCP connect to `ip:port`. Returns True if the host answered,
+    either by accepting or by actively refusing (RST) the connection.
+    """
+    s = socket.socket(socket.AF_INET6 if is_ipv6(ip) else socket.AF_INET, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        return s.connect_ex((ip, int(port))) in (0, errno.ECONNREFUSED)
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def ping_host(ip, probe_port=None) -> bool:
+    """
+    Pings `ip` through the shared ICMP socket, or the ping command if sockets are unavailable
+    or `ip` is an IPv6 address.
+    With `probe_port`, a quick TCP probe is tried first; ICMP is only used if it gets no answer
+    (some hosts filter TCP but still reply to echo requests).
+    """
+    if probe_port and tcp_probe(ip, probe_port):
+        return True
+    pinger = get_pinger()
+    if pinger is not None and not is_ipv6(ip):
+        return pinger.ping(ip)
+    return _ping_with_command(ip)
+
+
+class PingSignals(QObject):
+    """Signal carrier for PingTask (QRunnable is not a QObject and cannot own signals)."""
+
     finished = Signal()
     result_ready = Signal(int, str)  # device_id, status ("Online"/"Offline")
 
+
+class PingTask(QRunnable):
+    """
+    Pings a single device on a pooled worker thread and reports through `signals`.
+    Submit with `ping_thread_pool().start(task)` instead of creating a QThread per device.
+    """
+
     def __init__(self, device_info):
         super().__init__()
         self.device_info = device_info
+        self.signals = PingSignals()
 
-    def run_ping(self):
+    def run(self):
         """
-        Called when thread starts. Pings the device and emits the result.
+        Called by the thread pool. Pings the device and emits the result.
         """
         ip = self.device_info.get('ip')
         device_id = self.device_info.get('id', -1)
 
         try:
-            system_platform = platform.system().lower()
-
-            if 'windows' in system_platform:
-                param = '-n'
-                timeout_flag = '-w'  # milliseconds
-                timeout_value = '5000'
+            if ping_host(ip, self.device_info.get('probe_port')):
+                logger.info("Ping to %s successful.", ip)
+                self.signals.result_ready.emit(device_id, "Online")
             else:
-                param = '-c'
-                timeout_flag = '-W'  # seconds
-                timeout_value = '5'
-
-            command = ['ping', param, '1', timeout_flag, timeout_value, ip]
-            logger.debug(f"Pinging {ip} with command: {' '.join(command)}")
-
-            result = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=7  # overall timeout
-            )
-
-            logger.debug(f"Ping result for {ip}:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
-
-            if result.returncode == 0:
-                logger.info(f"Ping to {ip} successful.")
-                self.result_ready.emit(device_id, "Online")
-            else:
-                logger.warning(f"Ping to {ip} failed.")
-                self.result_ready.emit(device_id, "Offline")
+                logger.warning("Ping to %s failed.", ip)
+                self.signals.result_ready.emit(device_id, "Offline")
 
         except subprocess.TimeoutExpired:
-            logger.warning(f"Ping to {ip} timed out.")
-            self.result_ready.emit(device_id, "Offline")
+            logger.warning("Ping to %s timed out.", ip)
+            self.signals.result_ready.emit(device_id, "Offline")
 
         except Exception as e:
-            logger.error(f"Error pinging {ip}: {e}")
-            self.result_ready.emit(device_id, "Offline")
+            logger.error("Error pinging %s: %s", ip, e)
+            self.signals.result_ready.emit(device_id, "Offline")
 
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
+
+
+_ping_pool = None
+
+
+def ping_thread_pool() -> QThreadPool:
+    """
+    Returns the bounded thread pool used for PingTasks.
+    Its size comes from the "ping_concurrency" setting; a dedicated pool keeps
+    long ping waits from starving other users of QThreadPool.globalInstance().
+    """
+    global _ping_pool
+    if _ping_pool is None:
+        _ping_pool = QThreadPool()
+        default_size = min(64, (os.cpu_count() or 1) * 8)
+        _ping_pool.setMaxThreadCount(int(AppConfig.get_setting("ping_concurrency", default_size)))
+    return _ping_pool
 
 
 # OPTIONAL: Add a static/class method if you want to test outside of GUI
@@ -81,24 +321,8 @@ def ping_ip(ip):
     Standalone ping that returns True/False — can be used for testing.
     """
     try:
-        system_platform = platform.system().lower()
-        if 'windows' in system_platform:
-            param = '-n'
-            timeout_flag = '-w'
-            timeout_value = '5000'
-        else:
-            param = '-c'
-            timeout_flag = '-W'
-            timeout_value = '5'
-
-        command = ['ping', param, '1', timeout_flag, timeout_value, ip]
-        logger.debug(f"(Static) Pinging {ip} with command: {' '.join(command)}")
-
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=7)
-
-        logger.debug(f"(Static) Ping result:\n{result.stdout.strip()}")
-        return result.returncode == 0
+        return ping_host(ip)
 
     except Exception as e:
-        logger.error(f"(Static) Error pinging {ip}: {e}")
+        logger.error("(Static) Error pinging %s: %s", ip, e)
         return False
@@ -3,11 +3,13 @@
 # UPDATED: Added VLAN information fetching instead of uptime calculations
 
 import asyncio
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal
 from pysnmp.hlapi.asyncio import (
     SnmpEngine,
     CommunityData,
@@ -16,12 +18,62 @@ from pysnmp.hlapi.asyncio import (
     ObjectType,
     ObjectIdentity,
     get_cmd,
-    next_cmd,
     bulk_cmd,
 )
+from pysnmp.proto.rfc1902 import Counter32, Counter64, Gauge32, Integer, Integer32, Unsigned32
 
 from utils.logger import app_logger
 
+# Every request passes lookupMib=False: OIDs are handled numerically here, so resolving
+# each response varbind against the MIB tree is pure overhead.
+
+def _oid_tuple(oid: str) -> tuple:
+    """Dotted OID string -> tuple of ints, comparable with ObjectName.asTuple()."""
+    return tuple(int(part) for part in oid.split('.'))
+
+
+def _subtree_rows(varBinds, base: tuple) -> list:
+    """(name_tuple, value) for every varbind that lies under `base`."""
+    base_len = len(base)
+    return [(name_tuple, val) for name, val in varBinds if (name_tuple := name.asTuple())[:base_len] == base]
+
+
+# SNMP error-status value for a response that would not fit in one message.
+SNMP_ERR_TOO_BIG = 1
+
+# Numeric columns, and a converter per pysnmp numeric type. Decoded values keep their
+# native int in `_value`, so reading it skips int()'s __int__ dispatch and the
+# try/except around it on every counter cell.
+_INT_COLUMNS = frozenset({'ifOperStatus', 'ifAdminStatus', 'ifType', 'ifInOctets', 'ifOutOctets', 'ifSpeed'})
+_CONVERTERS = dict.fromkeys(
+    (Counter32, Counter64, Gauge32, Unsigned32, Integer, Integer32), attrgetter('_value')
+)
+
+
+def _to_int(value) -> int:
+    """Numeric column value -> int, 0 if the device sent something unusable."""
+    converter = _CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_mac(value) -> str:
+    """ifPhysAddress -> aa:bb:cc:dd:ee:ff, or its string form if it is not a MAC."""
+    if hasattr(value, 'asOctets'):
+        octets = value.asOctets()
+        if len(octets) == 6:
+            return octets.hex(':')
+    return str(value)
+
+
+# Converter per ifTable column, looked up once per walk rather than once per value.
+# Anything not listed is kept as a string.
+_COLUMN_CONVERTERS = {**dict.fromkeys(_INT_COLUMNS, _to_int), 'ifPhysAddress': _to_mac}
+
 
 class SNMPWorker(QObject):
     """Optimized worker class for performing SNMP operations in a separate thread."""
@@ -43,6 +95,21 @@ class SNMPWorker(QObject):
         'sysUpTime': '1.3.6.1.2.1.1.3.0',          # System uptime for calculations
     }
     
+    # ifTable columns that change at runtime, and ones that are effectively static
+    DYNAMIC_IF_OIDS = ['ifOperStatus', 'ifAdminStatus', 'ifInOctets', 'ifOutOctets']
+    STATIC_IF_OIDS = ['ifDescr', 'ifType', 'ifPhysAddress', 'ifSpeed']
+
+    # Static columns cached across polls: (host, oid_name) -> (timestamp, {if_index: value})
+    OID_CACHE_TTL = 3600  # seconds
+    _oid_cache: Dict[tuple, tuple] = {}
+    _uptime_cache: Dict[str, int] = {}  # host -> last sysUpTime, to spot reboots
+    # host -> (monotonic time, {if_index: (in_octets, out_octets)}) from the last poll
+    _counter_cache: Dict[str, tuple] = {}
+    # VLAN names change rarely: host -> (timestamp, {vlan_id: name}), re-walked after the TTL
+    VLAN_NAME_TTL = 600  # seconds
+    VLAN_NAME_COLUMNS = ('dot1qVlanStaticName', 'vtpVlanName')
+    _vlan_name_cache: Dict[str, tuple] = {}
+    
     # VLAN-related OIDs (IEEE 802.1Q VLAN MIB)
     VLAN_OID_MAPPING = {
         # Standard IEEE 802.1Q VLAN MIB OIDs
@@ -64,6 +131,28 @@ class SNMPWorker(QObject):
         'pethPsePortPowerConsumption': '1.3.6.1.2.1.105.1.1.1.4',  # Standard PoE power
     }
 
+    # Every OID above as a tuple of ints, built once. ObjectIdentity accepts these
+    # directly, so requests skip parsing dotted strings, and replies compare against them.
+    _OID_TUPLES = {
+        name: _oid_tuple(oid)
+        for name, oid in {**OID_MAPPING, **VLAN_OID_MAPPING, **POWER_OID_MAPPING}.items()
+    }
+    SYS_DESCR_OID = (1, 3, 6, 1, 2, 1, 1, 1, 0)
+    IF_NUMBER_OID = (1, 3, 6, 1, 2, 1, 2, 1, 0)
+
+    # One ObjectIdentity per fixed OID, shared by every poll. pysnmp resolves an identity
+    # in place the first time it is sent, so later requests skip resolution entirely;
+    # only walk cursors taken from replies are resolved afresh.
+    _RESOLVED_OIDS = {
+        name: ObjectIdentity(oid)
+        for name, oid in {**_OID_TUPLES, 'sysDescr': SYS_DESCR_OID, 'ifNumber': IF_NUMBER_OID}.items()
+    }
+
+    # GETBULK sizing: lower bound on max-repetitions for table walks, and how many
+    # ifDescr rows the interface-count estimate reads in its single request
+    MIN_MAX_REPETITIONS = 10
+    ESTIMATE_ROWS = 32
+
     def __init__(self, device_info: Dict[str, Any]):
         super().__init__()
         self.device_info = device_info
@@ -74,15 +163,33 @@ class SNMPWorker(QObject):
         self.retries = device_info.get("snmp_retries", 1)   # Reduced retries
         
         self.logger = app_logger.get_logger()
+
+        # One engine/auth/context per poll, shared by every request to this device,
+        # instead of rebuilding the engine (dispatcher, MIB loader) for each PDU.
+        self._engine = None
+        self._auth = CommunityData(self.community, mpModel=1)
+        self._context = ContextData()
+        self._table_max_rep = 20  # max-repetitions for per-interface tables, sized from ifNumber
+        self._if_number = None    # ifNumber.0 as reported by the device, when known
         
     def run(self):
-        """Main entry point - runs in separate thread."""
+        """Standalone entry point - runs the poll on a private event loop in the calling thread.
+        Prefer `snmp_poller.submit(worker)`, which shares one loop across all devices."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
         try:
-            # Run the async SNMP operations
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            result = loop.run_until_complete(self._fetch_interface_data())
+            loop.run_until_complete(self.poll())
+        finally:
+            loop.close()
+
+    async def poll(self, engine: Optional[SnmpEngine] = None):
+        """
+        Fetches the interface data and reports it through the worker's signals.
+        With `engine`, requests go through that (caller-owned) engine and its transport
+        instead of a private one created for this poll.
+        """
+        try:
+            result = await self._fetch_interface_data(engine)
             
             if result:
                 self.success.emit(result)
@@ -95,22 +202,31 @@ class SNMPWorker(QObject):
         finally:
             self.finished.emit()
 
-    async def _fetch_interface_data(self) -> List[Dict[str, Any]]:
+    async def _fetch_interface_data(self, engine: Optional[SnmpEngine] = None) -> List[Dict[str, Any]]:
         """Fetch comprehensive interface data via SNMP using optimized bulk operations."""
         self.logger.info(f"Starting optimized SNMP data collection for {self.host}")
         
+        self._engine = engine or SnmpEngine()
         try:
-            # Test connectivity first
-            if not await self._test_connectivity():
+            # Connectivity test, interface count and uptime in one round-trip
+            probe = await self._probe_device()
+            if probe is None:
                 return []
+            if_number, uptime = probe
             
-            # Get interface count
-            interface_count = await self._get_interface_count()
+            if if_number is not None:
+                self._if_number = if_number
+                # Add some buffer but cap at reasonable limit
+                interface_count = min(if_number + 5, 64)
+            else:
+                # Fallback: try to estimate by walking ifDescr briefly
+                interface_count = await self._estimate_interface_count()
             
-            if isinstance(interface_count, Exception):
-                interface_count = 20  # Default fallback
+            if uptime is not None:
+                self._check_for_reboot(uptime)
             
             self.logger.debug(f"Found {interface_count} interfaces on {self.host}")
+            self._table_max_rep = max(self.MIN_MAX_REPETITIONS, min(interface_count, 25))
             
             # Use bulk operations to fetch all interface data efficiently
             interface_data = await self._bulk_fetch_interface_data(interface_count)
@@ -119,37 +235,31 @@ class SNMPWorker(QObject):
                 self.logger.warning(f"No interfaces found for {self.host}")
                 return []
             
-            # Get VLAN and power data concurrently
-            vlan_data_task = self._get_vlan_data_bulk(list(interface_data.keys()))
-            power_data_task = self._get_power_data_bulk(list(interface_data.keys()))
-            
-            vlan_data, power_data = await asyncio.gather(
-                vlan_data_task, power_data_task, return_exceptions=True
+            # VLAN and power data come from one combined walk
+            vlan_data, power_data = await self._safe(
+                self._fetch_aux_data_bulk(frozenset(interface_data)), ({}, {})
             )
             
-            # Handle exceptions
-            if isinstance(vlan_data, Exception):
-                vlan_data = {}
-            if isinstance(power_data, Exception):
-                power_data = {}
-            
-            # Combine all data into final result
-            result = []
-            for if_index, data in interface_data.items():
-                interface_dict = {
+            # Combine all data into final result, one row per interface in index order
+            vlan_for = vlan_data.get
+            power_for = power_data.get
+            result = [
+                {
                     'Index': if_index,
                     'Description': data.get('ifDescr', f'Interface-{if_index}'),
                     'OpStatus': data.get('ifOperStatus', 2),  # Default to down
                     'AdminStatus': data.get('ifAdminStatus', 2),  # Default to down
-                    'VLAN': vlan_data.get(if_index, 'N/A'),  # VLAN information instead of uptime
+                    'VLAN': vlan_for(if_index, 'N/A'),  # VLAN information instead of uptime
                     'InOctets': data.get('ifInOctets', 0),
                     'OutOctets': data.get('ifOutOctets', 0),
                     'Speed': data.get('ifSpeed', 0),
                     'Type': data.get('ifType', 1),
                     'PhysAddress': data.get('ifPhysAddress', ''),
-                    'Power': power_data.get(if_index, 'N/A')
+                    'Power': power_for(if_index, 'N/A')
                 }
-                result.append(interface_dict)
+                for if_index, data in sorted(interface_data.items())
+            ]
+            self._add_traffic_rates(result)
             
             self.logger.info(f"Successfully retrieved {len(result)} interfaces from {self.host}")
             return result
@@ -157,9 +267,25 @@ class SNMPWorker(QObject):
         except Exception as e:
             self.logger.error(f"Error fetching interface data from {self.host}: {str(e)}")
             raise
+        finally:
+            if engine is None:
+                self._engine.close_dispatcher()
+            self._engine = None
 
-    async def _test_connectivity(self) -> bool:
-        """Test SNMP connectivity using sysDescr."""
+    async def _safe(self, coro, default):
+        """Await `coro`, returning `default` instead of raising if it fails."""
+        try:
+            return await coro
+        except Exception as e:
+            self.logger.debug(f"Optional SNMP data unavailable from {self.host}: {e}")
+            return default
+
+    async def _probe_device(self):
+        """
+        Test SNMP connectivity and read ifNumber and sysUpTime with a single GET.
+        Returns (if_number, uptime), either of which may be None if the device lacks it,
+        or None if the device did not answer.
+        """
         try:
             self.logger.debug(f"Testing SNMP connectivity to {self.host}")
             
@@ -170,64 +296,43 @@ class SNMPWorker(QObject):
             )
 
             result = await get_cmd(
-                SnmpEngine(),
-                CommunityData(self.community, mpModel=1),
+                self._engine,
+                self._auth,
                 target,
-                ContextData(),
-                ObjectType(ObjectIdentity("1.3.6.1.2.1.1.1.0"))  # sysDescr.0
+                self._context,
+                ObjectType(self._RESOLVED_OIDS['sysDescr']),
+                ObjectType(self._RESOLVED_OIDS['ifNumber']),
+                ObjectType(self._RESOLVED_OIDS['sysUpTime']),
+                lookupMib=False
             )
 
             errorIndication, errorStatus, errorIndex, varBinds = result
 
             if errorIndication:
                 self.logger.error(f"SNMP connectivity test failed for {self.host}: {errorIndication}")
-                return False
+                return None
             elif errorStatus:
                 self.logger.error(f"SNMP status error for {self.host}: {errorStatus.prettyPrint()}")
-                return False
-            else:
-                sys_descr = str(varBinds[0][1])
-                self.logger.debug(f"SNMP connectivity successful for {self.host}. Device: {sys_descr[:100]}...")
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"Exception during connectivity test for {self.host}: {str(e)}")
-            return False
-
-    async def _get_interface_count(self) -> int:
-        """Get the number of interfaces to optimize bulk operations."""
-        try:
-            target = await UdpTransportTarget.create(
-                (self.host, self.port),
-                timeout=self.timeout,
-                retries=self.retries,
-            )
-
-            # Get ifNumber (1.3.6.1.2.1.2.1.0) - standard interface count
-            result = await get_cmd(
-                SnmpEngine(),
-                CommunityData(self.community, mpModel=1),
-                target,
-                ContextData(),
-                ObjectType(ObjectIdentity("1.3.6.1.2.1.2.1.0"))
-            )
+                return None
 
-            errorIndication, errorStatus, errorIndex, varBinds = result
+            sys_descr = str(varBinds[0][1])
+            self.logger.debug(f"SNMP connectivity successful for {self.host}. Device: {sys_descr[:100]}...")
 
-            if not errorIndication and not errorStatus:
-                count = int(varBinds[0][1])
-                # Add some buffer but cap at reasonable limit
-                return min(count + 5, 64)
-            else:
-                # Fallback: try to estimate by walking ifDescr briefly
-                return await self._estimate_interface_count()
+            # v2c reports a missing object as a noSuchObject value, which int() rejects
+            values = []
+            for _, val in varBinds[1:3]:
+                try:
+                    values.append(int(val))
+                except (ValueError, TypeError):
+                    values.append(None)
+            return tuple(values)
                 
         except Exception as e:
-            self.logger.warning(f"Could not get interface count for {self.host}: {str(e)}")
-            return 20  # Conservative default
+            self.logger.error(f"Exception during connectivity test for {self.host}: {str(e)}")
+            return None
 
     async def _estimate_interface_count(self) -> int:
-        """Estimate interface count by walking ifDescr with early termination."""
+        """Estimate interface count from the first ESTIMATE_ROWS rows of ifDescr."""
         try:
             target = await UdpTransportTarget.create(
                 (self.host, self.port),
@@ -235,40 +340,36 @@ class SNMPWorker(QObject):
                 retries=0,
             )
 
-            count = 0
-            current_oid = ObjectIdentity(self.OID_MAPPING['ifDescr'])
+            base = self._OID_TUPLES['ifDescr']
+            
+            # Read the first rows of ifDescr in one GETBULK rather than a GETNEXT per row
+            result = await bulk_cmd(
+                self._engine,
+                self._auth,
+                target,
+                self._context,
+                0, self.ESTIMATE_ROWS,
+                ObjectType(self._RESOLVED_OIDS['ifDescr']),
+                lexicographicMode=False,
+                ignoreNonIncreasingOid=False,
+                lookupMib=False
+            )
+            
+            errorIndication, errorStatus, errorIndex, varBinds = result
+            
+            count = 0 if errorIndication or errorStatus else len(_subtree_rows(varBinds, base))
             
-            # Walk only first 32 interfaces for estimation
-            for _ in range(32):
-                result = await next_cmd(
-                    SnmpEngine(),
-                    CommunityData(self.community, mpModel=1),
-                    target,
-                    ContextData(),
-                    ObjectType(current_oid),
-                    lexicographicMode=False,
-                    ignoreNonIncreasingOid=False
-                )
-                
-                errorIndication, errorStatus, errorIndex, varBinds = result
-                
-                if errorIndication or errorStatus:
-                    break
-                
-                name, val = varBinds[0]
-                if not str(name).startswith(self.OID_MAPPING['ifDescr']):
-                    break
-                    
-                count += 1
-                current_oid = name
-                
             return max(count, 10)  # At least 10 interfaces assumption
             
         except Exception:
             return 20  # Safe default
 
     async def _bulk_fetch_interface_data(self, max_interfaces: int) -> Dict[int, Dict[str, Any]]:
-        """Fetch all interface data using efficient bulk operations."""
+        """
+        Fetch all interface data using efficient bulk operations.
+        Static columns (names, types, MACs, speeds) are served from a per-host cache
+        while it is fresh, so a repeat poll only walks the counters and status columns.
+        """
         interface_data = {}
         
         try:
@@ -278,387 +379,301 @@ class SNMPWorker(QObject):
                 retries=self.retries,
             )
 
-            # Define the OIDs we want to fetch (removed ifLastChange since we're not using uptime)
-            core_oids = [
-                'ifDescr', 'ifOperStatus', 'ifAdminStatus',
-                'ifInOctets', 'ifOutOctets', 'ifSpeed', 'ifType', 'ifPhysAddress'
-            ]
+            now = time.monotonic()
+            cached = {}
+            for oid_name in self.STATIC_IF_OIDS:
+                entry = SNMPWorker._oid_cache.get((self.host, oid_name))
+                if entry and now - entry[0] < self.OID_CACHE_TTL:
+                    cached[oid_name] = entry[1]
+            stale = [oid_name for oid_name in self.STATIC_IF_OIDS if oid_name not in cached]
 
-            # Create tasks for concurrent bulk fetching
-            fetch_tasks = []
-            for oid_name in core_oids:
-                task = self._bulk_fetch_single_oid(target, oid_name, max_interfaces)
-                fetch_tasks.append(task)
-
-            # Execute all bulk fetches concurrently
-            results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
-
-            # Process results
-            for i, result in enumerate(results):
-                oid_name = core_oids[i]
-                if isinstance(result, Exception):
-                    self.logger.warning(f"Failed to fetch {oid_name}: {result}")
-                    continue
-                
-                # Merge the OID data into interface_data
-                for if_index, value in result.items():
-                    if if_index not in interface_data:
-                        interface_data[if_index] = {}
-                    interface_data[if_index][oid_name] = value
+            interface_data = await self._walk_columns(
+                target, self.DYNAMIC_IF_OIDS + stale, max_interfaces, self._if_number
+            )
 
-            self.logger.debug(f"Bulk fetch completed for {len(interface_data)} interfaces")
+            # A new interface since the cache was filled: refresh the static columns too.
+            if cached and any(if_index not in column for column in cached.values() for if_index in interface_data):
+                self.logger.debug(f"Interface set changed on {self.host}; refreshing cached columns")
+                static_data = await self._walk_columns(target, list(cached), max_interfaces, self._if_number)
+                for if_index, values in static_data.items():
+                    interface_data.setdefault(if_index, {}).update(values)
+                stale.extend(cached)
+                cached = {}
+
+            for oid_name in stale:
+                SNMPWorker._oid_cache[(self.host, oid_name)] = (now, {
+                    if_index: values[oid_name] for if_index, values in interface_data.items() if oid_name in values
+                })
+            for oid_name, column in cached.items():
+                for if_index, values in interface_data.items():
+                    if if_index in column:
+                        values[oid_name] = column[if_index]
+
+            self.logger.debug(f"Bulk fetch completed for {len(interface_data)} interfaces "
+                              f"({len(cached)} static columns from cache)")
             
         except Exception as e:
             self.logger.error(f"Error in bulk fetch from {self.host}: {str(e)}")
             
         return interface_data
 
-    async def _bulk_fetch_single_oid(self, target, oid_name: str, max_interfaces: int) -> Dict[int, Any]:
-        """Bulk fetch a single OID table."""
-        oid_data = {}
-        oid_base = self.OID_MAPPING[oid_name]
-        
-        try:
-            self.logger.debug(f"Bulk fetching {oid_name} from {self.host}")
+    def _check_for_reboot(self, uptime: int):
+        """Drops this host's cached columns if sysUpTime went backwards (the device rebooted)."""
+        last_uptime = SNMPWorker._uptime_cache.get(self.host)
+        SNMPWorker._uptime_cache[self.host] = uptime
+        if last_uptime is not None and uptime < last_uptime:
+            self.logger.debug(f"{self.host} rebooted; dropping cached interface columns")
+            for oid_name in self.STATIC_IF_OIDS:
+                SNMPWorker._oid_cache.pop((self.host, oid_name), None)
+            SNMPWorker._counter_cache.pop(self.host, None)  # counters restarted from zero
+            SNMPWorker._vlan_name_cache.pop(self.host, None)
+
+    def _add_traffic_rates(self, interfaces: List[Dict[str, Any]]):
+        """
+        Sets 'InRate'/'OutRate' (bytes per second) on each row from how far its octet
+        counters moved since the previous poll of this host; None until there is one.
+        Counter32 wraparound is handled by taking the difference modulo 2**32.
+        """
+        now = time.monotonic()
+        previous_time, previous = SNMPWorker._counter_cache.get(self.host, (None, {}))
+        elapsed = now - previous_time if previous_time is not None else 0
+
+        counters = {}
+        for iface in interfaces:
+            current = counters[iface['Index']] = (iface['InOctets'], iface['OutOctets'])
+            last = previous.get(iface['Index'])
+            if last is None or elapsed <= 0:
+                iface['InRate'] = iface['OutRate'] = None
+            else:
+                iface['InRate'] = ((current[0] - last[0]) & 0xFFFFFFFF) / elapsed
+                iface['OutRate'] = ((current[1] - last[1]) & 0xFFFFFFFF) / elapsed
+        SNMPWorker._counter_cache[self.host] = (now, counters)
+
+    async def _walk_columns(self, target, columns: List[str], max_interfaces: int,
+                            expected_count: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Walk several ifTable columns in the same GETBULK.
+        Each repetition in a response carries one row (one value per column), so the
+        whole table costs one round-trip per `max_rep` interfaces instead of one per column.
+        With `expected_count` (ifNumber), the walk ends as soon as that many rows are in,
+        instead of paying one more round-trip just to see the table end.
+        """
+        interface_data = {}
+        base_tuples = [self._OID_TUPLES[oid_name] for oid_name in columns]
+        base_len = len(base_tuples[0])  # every ifTable column OID has the same length
+        width = len(columns)
+
+        self.logger.debug(f"Bulk fetching {width} interface columns from {self.host}")
+
+        current_oids = [self._RESOLVED_OIDS[oid_name] for oid_name in columns]
+        converters = [_COLUMN_CONVERTERS.get(oid_name, str) for oid_name in columns]
+        rows_found = 0
+        table_done = False
+        # Rows per response: as many as the device has, but keep width * max_rep
+        # around 500 varbinds so the response stays within one message.
+        max_rep = max(5, min(max_interfaces, 512 // width))
+
+        while not table_done and rows_found < max_interfaces:
+            result = await bulk_cmd(
+                self._engine,
+                self._auth,
+                target,
+                self._context,
+                0, max_rep,  # Non-repeaters, max-repetitions (rows per response)
+                *[ObjectType(oid) for oid in current_oids],
+                lexicographicMode=False,
+                ignoreNonIncreasingOid=False,
+                lookupMib=False
+            )
             
-            # Use bulk_cmd for efficient table walking
-            current_oid = ObjectIdentity(oid_base)
-            interfaces_found = 0
+            errorIndication, errorStatus, errorIndex, varBinds = result
             
-            while interfaces_found < max_interfaces:
-                result = await bulk_cmd(
-                    SnmpEngine(),
-                    CommunityData(self.community, mpModel=1),
-                    target,
-                    ContextData(),
-                    0, 10,  # Non-repeaters, max-repetitions
-                    ObjectType(current_oid),
-                    lexicographicMode=False,
-                    ignoreNonIncreasingOid=False
-                )
-                
-                errorIndication, errorStatus, errorIndex, varBinds = result
-                
-                if errorIndication:
-                    self.logger.debug(f"Bulk fetch ended for {oid_name}: {errorIndication}")
-                    break
-                elif errorStatus:
-                    self.logger.debug(f"Bulk fetch error for {oid_name}: {errorStatus}")
-                    break
-                
-                if not varBinds:
-                    break
-                
-                found_in_batch = False
-                for varBind in varBinds:
-                    name, val = varBind
-                    name_str = str(name)
-                    
-                    # Check if we're still in the correct OID tree
-                    if not name_str.startswith(oid_base):
+            if errorIndication:
+                self.logger.debug(f"Bulk fetch ended for {self.host}: {errorIndication}")
+                break
+            elif errorStatus and int(errorStatus) == SNMP_ERR_TOO_BIG and max_rep > 1:
+                max_rep //= 2
+                self.logger.debug(f"Response too big from {self.host}; retrying with max-repetitions {max_rep}")
+                continue
+            elif errorStatus:
+                self.logger.debug(f"Bulk fetch error for {self.host}: {errorStatus}")
+                break
+            
+            if len(varBinds) < width:
+                break  # not even one complete row
+
+            # varBinds is row-major: [row0col0, row0col1, ..., row1col0, ...]
+            for row_start in range(0, len(varBinds) - width + 1, width):
+                for col in range(width):
+                    name, val = varBinds[row_start + col]
+                    name_tuple = name.asTuple()
+
+                    # Stop once any column walks past the end of its table.
+                    if name_tuple[:base_len] != base_tuples[col]:
+                        table_done = True
                         break
-                        
-                    # Extract interface index
-                    try:
-                        if_index = int(name_str.split('.')[-1])
-                        oid_data[if_index] = self._convert_snmp_value(oid_name, val)
-                        interfaces_found += 1
-                        found_in_batch = True
-                        current_oid = name
-                    except (ValueError, IndexError):
-                        continue
-                
-                if not found_in_batch:
+
+                    if_index = name_tuple[-1]
+                    oid_name = columns[col]
+                    interface_data.setdefault(if_index, {})[oid_name] = converters[col](val)
+
+                if table_done:
                     break
-                    
-        except Exception as e:
-            self.logger.warning(f"Error bulk fetching {oid_name}: {str(e)}")
-            
-        return oid_data
+                rows_found += 1
+
+            if not table_done:
+                # The next page continues from the last complete row of this one.
+                last_row = (len(varBinds) // width - 1) * width
+                current_oids = [ObjectIdentity(name) for name, _ in varBinds[last_row:last_row + width]]
+
+            if expected_count and len(interface_data) >= expected_count:
+                break
 
-    async def _get_vlan_data_bulk(self, interface_indices: List[int]) -> Dict[int, str]:
-        """Fetch VLAN information using multiple methods for better compatibility."""
+        return interface_data
+
+    # VLAN and power tables walked together in one GETBULK per page
+    AUX_COLUMNS = [
+        'dot1qPvid', 'vmVlan', 'dot1qVlanStaticName', 'vtpVlanName',
+        'cethPsePortPower', 'pethPsePortPowerConsumption',
+    ]
+    AUX_MAX_PAGES = 10  # upper bound on round-trips for the auxiliary walk
+
+    async def _fetch_aux_data_bulk(self, interface_indices: FrozenSet[int]) -> tuple:
+        """
+        Fetch VLAN and power information for the given interfaces.
+        Returns (vlan_data, power_data), both keyed by interface index, with "N/A"
+        wherever the device has no answer.
+        """
         vlan_data = {}
-        
+        power_data = {}
+
         try:
             target = await UdpTransportTarget.create(
                 (self.host, self.port),
-                timeout=2,  # Slightly longer timeout for VLAN data
+                timeout=2,  # Slightly longer timeout for optional data
                 retries=1,
             )
-
-            # Method 1: Try IEEE 802.1Q PVID (Port VLAN ID)
-            pvid_data = await self._fetch_pvid_data(target, interface_indices)
-            if pvid_data:
-                vlan_data.update(pvid_data)
-                self.logger.debug(f"Retrieved PVID data for {len(pvid_data)} interfaces")
-
-            # Method 2: Try Cisco VLAN membership (if PVID didn't work or incomplete)
-            if not vlan_data or len(vlan_data) < len(interface_indices) / 2:
-                cisco_vlan_data = await self._fetch_cisco_vlan_data(target, interface_indices)
-                if cisco_vlan_data:
+            now = time.monotonic()
+            entry = SNMPWorker._vlan_name_cache.get(self.host)
+            vlan_names = entry[1] if entry and now - entry[0] < self.VLAN_NAME_TTL else None
+            columns = self.AUX_COLUMNS if vlan_names is None else [
+                oid_name for oid_name in self.AUX_COLUMNS if oid_name not in self.VLAN_NAME_COLUMNS
+            ]
+            tables = await self._walk_tables(target, columns)
+
+            # Method 1: IEEE 802.1Q PVID (Port VLAN ID)
+            # Port index maps to interface index (they're often the same)
+            vlan_data.update({
+                name_tuple[-1]: str(int(val))
+                for name_tuple, val in tables['dot1qPvid'] if name_tuple[-1] in interface_indices
+            })
+
+            # Method 2: Cisco VLAN membership (if PVID didn't work or incomplete)
+            if len(vlan_data) < len(interface_indices) / 2:
+                for name_tuple, val in tables['vmVlan']:
+                    if_index = name_tuple[-1]
                     # Merge with existing data, preferring specific PVID data
-                    for if_index, vlan_info in cisco_vlan_data.items():
-                        if if_index not in vlan_data:
-                            vlan_data[if_index] = vlan_info
-                    self.logger.debug(f"Retrieved Cisco VLAN data for {len(cisco_vlan_data)} interfaces")
-
-            # Method 3: Try to get VLAN names for better display
-            if vlan_data:
-                vlan_names = await self._fetch_vlan_names(target)
+                    if if_index in interface_indices and if_index not in vlan_data:
+                        vlan_data[if_index] = str(int(val))
+
+            # Method 3: VLAN names for better display, IEEE table first, then Cisco VTP
+            if vlan_names is None:
+                vlan_names = {
+                    name_tuple[-1]: vlan_name  # VLAN ID is the last OID component
+                    for name_tuple, val in tables['dot1qVlanStaticName'] or tables['vtpVlanName']
+                    if (vlan_name := str(val).strip())
+                }
+                # An empty result may just be a failed or timed-out walk; ask again next poll.
                 if vlan_names:
-                    # Enhance VLAN data with names
-                    for if_index, vlan_info in vlan_data.items():
-                        if isinstance(vlan_info, str) and vlan_info.isdigit():
-                            vlan_id = int(vlan_info)
-                            if vlan_id in vlan_names:
-                                vlan_data[if_index] = f"{vlan_id} ({vlan_names[vlan_id]})"
-                    
-        except Exception as e:
-            self.logger.debug(f"VLAN data not available for {self.host}: {str(e)}")
-            
-        # Fill in N/A for interfaces without VLAN data
-        for index in interface_indices:
-            if index not in vlan_data:
-                vlan_data[index] = "N/A"
-                
-        return vlan_data
+                    SNMPWorker._vlan_name_cache[self.host] = (now, vlan_names)
+            if vlan_data and vlan_names:
+                for if_index, vlan_info in vlan_data.items():
+                    if vlan_info.isdigit() and (vlan_name := vlan_names.get(int(vlan_info))):
+                        vlan_data[if_index] = f"{vlan_info} ({vlan_name})"
+
+            # Power: use the first vendor table that answered
+            for power_oid_name in self.POWER_OID_MAPPING:
+                if rows := tables[power_oid_name]:
+                    power_data.update({
+                        name_tuple[-1]: f"{power_value / 1000:.1f}W" if (power_value := int(val)) > 0 else "0W"
+                        for name_tuple, val in rows if name_tuple[-1] in interface_indices
+                    })
+                    break
 
-    async def _fetch_pvid_data(self, target, interface_indices: List[int]) -> Dict[int, str]:
-        """Fetch Port VLAN ID (PVID) using IEEE 802.1Q standard OID."""
-        pvid_data = {}
-        
-        try:
-            # Try to bulk fetch PVID data
-            current_oid = ObjectIdentity(self.VLAN_OID_MAPPING['dot1qPvid'])
-            
-            result = await bulk_cmd(
-                SnmpEngine(),
-                CommunityData(self.community, mpModel=1),
-                target,
-                ContextData(),
-                0, 20,  # Get up to 20 PVID entries at once
-                ObjectType(current_oid),
-                lexicographicMode=False,
-                ignoreNonIncreasingOid=False
-            )
-            
-            errorIndication, errorStatus, errorIndex, varBinds = result
-            
-            if not errorIndication and not errorStatus and varBinds:
-                for varBind in varBinds:
-                    name, val = varBind
-                    name_str = str(name)
-                    
-                    if not name_str.startswith(self.VLAN_OID_MAPPING['dot1qPvid']):
-                        continue
-                        
-                    try:
-                        # Extract port index from OID
-                        port_index = int(name_str.split('.')[-1])
-                        vlan_id = int(val)
-                        
-                        # Map port index to interface index (they're often the same)
-                        if port_index in interface_indices:
-                            pvid_data[port_index] = str(vlan_id)
-                            
-                    except (ValueError, IndexError):
-                        continue
-                        
         except Exception as e:
-            self.logger.debug(f"Could not fetch PVID data: {e}")
-            
-        return pvid_data
+            self.logger.debug(f"VLAN/power data not available for {self.host}: {str(e)}")
 
-    async def _fetch_cisco_vlan_data(self, target, interface_indices: List[int]) -> Dict[int, str]:
-        """Fetch VLAN data using Cisco-specific OIDs."""
-        cisco_vlan_data = {}
-        
-        try:
-            # Try Cisco VLAN membership OID
-            current_oid = ObjectIdentity(self.VLAN_OID_MAPPING['vmVlan'])
-            
+        # Fill in N/A for interfaces without VLAN or power data
+        for index in interface_indices:
+            vlan_data.setdefault(index, "N/A")
+            power_data.setdefault(index, "N/A")
+
+        return vlan_data, power_data
+
+    async def _walk_tables(self, target, oid_names: List[str]) -> Dict[str, list]:
+        """
+        Walk several unrelated tables in the same GETBULK.
+        Unlike `_walk_columns`, each table ends on its own: a table that runs out
+        (or that the device does not have) is dropped from the next request while
+        the others carry on. Returns {oid_name: [(name_tuple, value), ...]}.
+        """
+        rows = {oid_name: [] for oid_name in oid_names}
+        bases = {oid_name: self._OID_TUPLES[oid_name] for oid_name in oid_names}
+        cursors = dict(bases)  # last OID seen per table, as a tuple
+        active = list(oid_names)
+        max_rep = max(self.MIN_MAX_REPETITIONS, min(self._table_max_rep * 2, 512 // len(oid_names)))
+
+        for _ in range(self.AUX_MAX_PAGES):
+            if not active:
+                break
             result = await bulk_cmd(
-                SnmpEngine(),
-                CommunityData(self.community, mpModel=1),
+                self._engine,
+                self._auth,
                 target,
-                ContextData(),
-                0, 20,  # Get up to 20 VLAN entries at once
-                ObjectType(current_oid),
+                self._context,
+                0, max_rep,
+                *[ObjectType(
+                    self._RESOLVED_OIDS[oid_name] if cursors[oid_name] is bases[oid_name]
+                    else ObjectIdentity(cursors[oid_name])
+                ) for oid_name in active],
                 lexicographicMode=False,
-                ignoreNonIncreasingOid=False
+                ignoreNonIncreasingOid=False,
+                lookupMib=False
             )
-            
-            errorIndication, errorStatus, errorIndex, varBinds = result
-            
-            if not errorIndication and not errorStatus and varBinds:
-                for varBind in varBinds:
-                    name, val = varBind
-                    name_str = str(name)
-                    
-                    if not name_str.startswith(self.VLAN_OID_MAPPING['vmVlan']):
-                        continue
-                        
-                    try:
-                        # Extract interface index from OID
-                        if_index = int(name_str.split('.')[-1])
-                        vlan_id = int(val)
-                        
-                        if if_index in interface_indices:
-                            cisco_vlan_data[if_index] = str(vlan_id)
-                            
-                    except (ValueError, IndexError):
-                        continue
-                        
-        except Exception as e:
-            self.logger.debug(f"Could not fetch Cisco VLAN data: {e}")
-            
-        return cisco_vlan_data
 
-    async def _fetch_vlan_names(self, target) -> Dict[int, str]:
-        """Fetch VLAN names for better display."""
-        vlan_names = {}
-        
-        try:
-            # Try IEEE 802.1Q VLAN name table
-            current_oid = ObjectIdentity(self.VLAN_OID_MAPPING['dot1qVlanStaticName'])
-            
-            result = await bulk_cmd(
-                SnmpEngine(),
-                CommunityData(self.community, mpModel=1),
-                target,
-                ContextData(),
-                0, 50,  # Get up to 50 VLAN names at once
-                ObjectType(current_oid),
-                lexicographicMode=False,
-                ignoreNonIncreasingOid=False
-            )
-            
             errorIndication, errorStatus, errorIndex, varBinds = result
-            
-            if not errorIndication and not errorStatus and varBinds:
-                for varBind in varBinds:
-                    name, val = varBind
-                    name_str = str(name)
-                    
-                    if not name_str.startswith(self.VLAN_OID_MAPPING['dot1qVlanStaticName']):
-                        continue
-                        
-                    try:
-                        # Extract VLAN ID from OID
-                        vlan_id = int(name_str.split('.')[-1])
-                        vlan_name = str(val).strip()
-                        
-                        if vlan_name and vlan_name != '':
-                            vlan_names[vlan_id] = vlan_name
-                            
-                    except (ValueError, IndexError):
-                        continue
-                        
-        except Exception as e:
-            # Try Cisco VLAN name table as fallback
-            try:
-                current_oid = ObjectIdentity(self.VLAN_OID_MAPPING['vtpVlanName'])
-                
-                result = await bulk_cmd(
-                    SnmpEngine(),
-                    CommunityData(self.community, mpModel=1),
-                    target,
-                    ContextData(),
-                    0, 50,
-                    ObjectType(current_oid),
-                    lexicographicMode=False,
-                    ignoreNonIncreasingOid=False
-                )
-                
-                errorIndication, errorStatus, errorIndex, varBinds = result
-                
-                if not errorIndication and not errorStatus and varBinds:
-                    for varBind in varBinds:
-                        name, val = varBind
-                        name_str = str(name)
-                        
-                        if not name_str.startswith(self.VLAN_OID_MAPPING['vtpVlanName']):
-                            continue
-                            
-                        try:
-                            vlan_id = int(name_str.split('.')[-2])  # Different OID structure
-                            vlan_name = str(val).strip()
-                            
-                            if vlan_name and vlan_name != '':
-                                vlan_names[vlan_id] = vlan_name
-                                
-                        except (ValueError, IndexError):
-                            continue
-                            
-            except Exception:
-                self.logger.debug(f"Could not fetch VLAN names: {e}")
-            
-        return vlan_names
 
-    async def _get_power_data_bulk(self, interface_indices: List[int]) -> Dict[int, str]:
-        """Fetch power consumption data using bulk operations."""
-        power_data = {}
-        
-        try:
-            target = await UdpTransportTarget.create(
-                (self.host, self.port),
-                timeout=1,  # Shorter timeout for optional data
-                retries=0,
-            )
+            if errorIndication:
+                self.logger.debug(f"Table walk ended for {self.host}: {errorIndication}")
+                break
+            elif errorStatus and int(errorStatus) == SNMP_ERR_TOO_BIG and max_rep > 1:
+                max_rep //= 2
+                continue
+            elif errorStatus:
+                self.logger.debug(f"Table walk error for {self.host}: {errorStatus}")
+                break
+
+            if not varBinds:
+                break
+
+            # varBinds is row-major over the tables requested in this round
+            width = len(active)
+            finished = set()
+            for offset, oid_name in enumerate(active):
+                base = bases[oid_name]
+                base_len = len(base)
+                table_rows = rows[oid_name]
+                for name, val in varBinds[offset::width]:
+                    name_tuple = name.asTuple()
+                    # Past the end of this table, or no progress (endOfMibView)
+                    if name_tuple[:base_len] != base or name_tuple <= cursors[oid_name]:
+                        finished.add(oid_name)
+                        break
+                    table_rows.append((name_tuple, val))
+                    cursors[oid_name] = name_tuple
+            active = [oid_name for oid_name in active if oid_name not in finished]
 
-            # Try to bulk fetch power data
-            for power_oid_name, power_oid in self.POWER_OID_MAPPING.items():
-                try:
-                    current_oid = ObjectIdentity(power_oid)
-                    
-                    result = await bulk_cmd(
-                        SnmpEngine(),
-                        CommunityData(self.community, mpModel=1),
-                        target,
-                        ContextData(),
-                        0, 20,  # Get up to 20 power readings at once
-                        ObjectType(current_oid),
-                        lexicographicMode=False,
-                        ignoreNonIncreasingOid=False
-                    )
-                    
-                    errorIndication, errorStatus, errorIndex, varBinds = result
-                    
-                    if not errorIndication and not errorStatus and varBinds:
-                        for varBind in varBinds:
-                            name, val = varBind
-                            name_str = str(name)
-                            
-                            if not name_str.startswith(power_oid):
-                                continue
-                                
-                            try:
-                                if_index = int(name_str.split('.')[-1])
-                                if if_index in interface_indices:
-                                    power_value = int(val)
-                                    if power_value > 0:
-                                        power_data[if_index] = f"{power_value / 1000:.1f}W"
-                                    else:
-                                        power_data[if_index] = "0W"
-                            except (ValueError, IndexError):
-                                continue
-                        
-                        if power_data:
-                            break  # Found power data, stop trying other OIDs
-                            
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            self.logger.debug(f"Power data not available for {self.host}: {str(e)}")
-            
-        # Fill in N/A for interfaces without power data
-        for index in interface_indices:
-            if index not in power_data:
-                power_data[index] = "N/A"
-                
-        return power_data
+        return rows
 
     def _get_default_value(self, oid_name: str) -> Any:
         """Return default values for OIDs that might not be available."""
@@ -674,51 +689,66 @@ class SNMPWorker(QObject):
         }
         return defaults.get(oid_name, 0)
 
-    def _convert_snmp_value(self, oid_name: str, value) -> Any:
-        """Convert SNMP values to appropriate Python types with better error handling."""
-        try:
-            if oid_name in ['ifOperStatus', 'ifAdminStatus', 'ifType']:
-                return int(value)
-            elif oid_name in ['ifInOctets', 'ifOutOctets', 'ifSpeed']:
-                # Ensure we always return an integer for these fields
-                try:
-                    return int(value)
-                except (ValueError, TypeError):
-                    # If conversion fails, return 0 instead of string
-                    self.logger.debug(f"Could not convert {oid_name} value '{value}' to int, using 0")
-                    return 0
-            elif oid_name == 'ifPhysAddress':
-                # Convert bytes to MAC address format
-                if hasattr(value, 'asOctets'):
-                    octets = value.asOctets()
-                    if len(octets) == 6:
-                        return ':'.join(f'{b:02x}' for b in octets)
-                return str(value)
-            else:
-                return str(value)
-        except (ValueError, TypeError) as e:
-            self.logger.debug(f"Error converting SNMP value for {oid_name}: {e}")
-            # Return appropriate default based on OID type
-            if oid_name in ['ifInOctets', 'ifOutOctets', 'ifSpeed', 'ifOperStatus', 'ifAdminStatus', 'ifType']:
-                return 0
-            else:
-                return str(value)
-
 
-# Alternative implementation using QThread directly (if preferred)
-class SNMPThread(QThread):
-    """Alternative QThread-based implementation."""
-    
-    success = Signal(list)
-    error = Signal(str)
-    
-    def __init__(self, device_info: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.device_info = device_info
-        
-    def run(self):
-        """Run SNMP operations in thread."""
-        worker = SNMPWorker(self.device_info)
-        worker.success.connect(self.success.emit)
-        worker.error.connect(self.error.emit)
-        worker.run()
\ No newline at end of file
+class SNMPPollerService:
+    """
+    Runs every SNMPWorker poll on one shared asyncio event loop in a single background
+    thread, instead of a QThread and a fresh event loop per device. A semaphore bounds
+    how many devices are polled at once. Signals emitted by the workers are queued to
+    the receivers' (GUI) thread by Qt as usual.
+
+    All polls share one SnmpEngine, and so one UDP socket: replies for every device
+    are read by a single datagram endpoint on the loop rather than one socket per poll.
+    """
+
+    def __init__(self, max_concurrent: int = 50):
+        self.max_concurrent = max_concurrent
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._engine = None
+        self._lock = threading.Lock()
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run_loop, name="SNMPPoller", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _poll(self, worker: SNMPWorker):
+        if self._semaphore is None:
+            # Created on the loop's own thread so they bind to that loop.
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._engine = SnmpEngine()
+        async with self._semaphore:
+            await worker.poll(self._engine)
+
+    def _shutdown(self):
+        if self._engine is not None:
+            self._engine.close_dispatcher()
+            self._engine = None
+        self._loop.stop()
+
+    def submit(self, worker: SNMPWorker):
+        """Schedules `worker` on the shared loop; returns a concurrent.futures.Future."""
+        loop = self._ensure_running()
+        return asyncio.run_coroutine_threadsafe(self._poll(worker), loop)
+
+    def stop(self):
+        """Stops the shared loop (pending polls are abandoned)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                self._loop.call_soon_threadsafe(self._shutdown)
+                self._thread.join(timeout=2)
+            self._thread = None
+            self._semaphore = None
+
+
+snmp_poller = SNMPPollerService()
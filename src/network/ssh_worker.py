@@ -1,14 +1,159 @@
 # network/ssh_worker.py
-# Description: Handles SSH connections and command execution in a background thread.
+# Description: Handles SSH connections and command execution on a shared worker pool.
 
 import paramiko
 import json
 import os
-from PySide6.QtCore import QObject, Signal
-from datetime import datetime
+import threading
+import time
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
+from config.app_config import AppConfig
 from utils.logger import app_logger
-from utils.database import db_manager
+from utils.clock import now_str
+from utils.database import backup_writer
+
+SSH_IDLE_TIMEOUT = 300  # seconds an unused connection stays open
+SSH_READ_TIMEOUT = 10   # seconds to wait for the next chunk of command output
+SSH_RECV_SIZE = 65536
+KNOWN_HOSTS_PATH = os.path.join(os.path.expanduser("~"), ".nmsimple", "known_hosts")
+# SHA-1 / finite-field key exchanges: slow, and only negotiated when a device offers nothing better.
+LEGACY_KEX = (
+    "diffie-hellman-group1-sha1",
+    "diffie-hellman-group14-sha1",
+    "diffie-hellman-group-exchange-sha1",
+)
+
+_known_hosts_lock = threading.Lock()
+
+
+class _TrustOnFirstUsePolicy(paramiko.MissingHostKeyPolicy):
+    """
+    Accepts the key of a device seen for the first time and records it in known_hosts.
+    Later connections are verified against the stored key, so a changed key is rejected.
+    """
+
+    def missing_host_key(self, client, hostname, key):
+        with _known_hosts_lock:
+            # Re-read the file so concurrent first connections don't drop each other's entries.
+            host_keys = paramiko.HostKeys(KNOWN_HOSTS_PATH)
+            host_keys.add(hostname, key.get_name(), key)
+            host_keys.save(KNOWN_HOSTS_PATH)
+
+
+class SSHConnectionPool:
+    """
+    Keeps authenticated SSH clients open between operations, keyed by (ip, username),
+    so repeat backups of a device skip the TCP connect, key exchange and login.
+    A client is handed to one caller at a time: `get` takes it out of the pool and
+    `release` puts it back. Clients left idle for `idle_timeout` are closed by a reaper thread.
+    """
+
+    def __init__(self, idle_timeout: float = SSH_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._clients = {}  # (ip, username) -> (client, last released at)
+        self._lock = threading.Lock()
+        self._reaper = None
+        self._stop = threading.Event()
+
+    def get(self, ip: str, username: str, password: str) -> paramiko.SSHClient:
+        """Returns an idle, still-connected client for the device, or connects a new one."""
+        with self._lock:
+            entry = self._clients.pop((ip, username), None)
+        if entry is not None:
+            client = entry[0]
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                return client
+            client.close()
+
+        return self._connect(ip, username, password)
+
+    def _connect(self, ip: str, username: str, password: str) -> paramiko.SSHClient:
+        """
+        Opens a new session, checking the device against the persistent known_hosts file.
+        A stored key also makes paramiko negotiate that key type first instead of trying RSA.
+        """
+        with _known_hosts_lock:
+            os.makedirs(os.path.dirname(KNOWN_HOSTS_PATH), exist_ok=True)
+            open(KNOWN_HOSTS_PATH, 'a').close()
+        client = paramiko.SSHClient()
+        client.load_host_keys(KNOWN_HOSTS_PATH)
+        if AppConfig.get_setting("ssh_strict_host_keys", False):
+            client.set_missing_host_key_policy(paramiko.RejectPolicy())
+        else:
+            client.set_missing_host_key_policy(_TrustOnFirstUsePolicy())
+        disabled = {} if AppConfig.get_setting("ssh_legacy_kex", False) else {"kex": list(LEGACY_KEX)}
+        client.connect(hostname=ip, username=username, password=password, timeout=10,
+                       disabled_algorithms=disabled)
+        return client
+
+    def release(self, ip: str, username: str, client: paramiko.SSHClient):
+        """Returns a healthy client to the pool for reuse."""
+        with self._lock:
+            previous = self._clients.get((ip, username))
+            self._clients[(ip, username)] = (client, time.monotonic())
+            if self._reaper is None:
+                self._stop.clear()
+                self._reaper = threading.Thread(target=self._reap, name="SSHPoolReaper", daemon=True)
+                self._reaper.start()
+        if previous is not None and previous[0] is not client:
+            previous[0].close()  # two sessions to the same device overlapped; keep the newest
+
+    def discard(self, client: paramiko.SSHClient):
+        """Closes a client that failed mid-operation instead of returning it."""
+        client.close()
+
+    def close_all(self):
+        """Stops the reaper and closes every pooled connection."""
+        self._stop.set()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            self._reaper = None
+        for client, _ in clients.values():
+            client.close()
+
+    def _reap(self):
+        while not self._stop.wait(min(30, self.idle_timeout)):
+            cutoff = time.monotonic() - self.idle_timeout
+            with self._lock:
+                expired = [key for key, (_, last_used) in self._clients.items() if last_used < cutoff]
+                idle = [self._clients.pop(key)[0] for key in expired]
+            for client in idle:
+                client.close()
+
+
+ssh_pool = SSHConnectionPool()
+
+
+def run_command(client: paramiko.SSHClient, command: str) -> tuple:
+    """
+    Runs `command` on its own channel and returns (stdout, stderr) as bytes.
+    Output is streamed into one growing buffer as it arrives instead of being read
+    through file objects at EOF; stderr is drained alongside so neither stream stalls the other.
+    """
+    channel = client.get_transport().open_session()
+    try:
+        channel.settimeout(SSH_READ_TIMEOUT)
+        channel.exec_command(command)
+        output = bytearray()
+        errors = bytearray()
+        while True:
+            chunk = channel.recv(SSH_RECV_SIZE)
+            while channel.recv_stderr_ready():
+                errors += channel.recv_stderr(SSH_RECV_SIZE)
+            if not chunk:
+                break
+            output += chunk
+        while True:
+            chunk = channel.recv_stderr(SSH_RECV_SIZE)
+            if not chunk:
+                break
+            errors += chunk
+        return output, errors
+    finally:
+        channel.close()
+
 
 class SSHWorker(QObject):
     finished = Signal()
@@ -24,6 +169,7 @@ class SSHWorker(QObject):
         device_id = self.device_info['id']
         ip = self.device_info['ip']
         self.logger.info(f"Starting backup task for {self.device_info['name']} ({ip})...")
+        saving = False
 
         try:
             username = self.device_info.get("username")
@@ -32,30 +178,78 @@ class SSHWorker(QObject):
             if not username or not password:
                 raise ValueError("Missing SSH username or password for device.")
 
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(hostname=ip, username=username, password=password, timeout=10)
+            client = ssh_pool.get(ip, username, password)
 
             self.logger.info(f"SSH connection established for device ID: {device_id}")
             
-            stdin, stdout, stderr = client.exec_command('show running-config')
-            config_output = stdout.read().decode('utf-8')
-            error_output = stderr.read().decode('utf-8')
-            client.close()
-
-            if error_output:
-                raise IOError(error_output)
+            try:
+                output, errors = run_command(client, 'show running-config')
+            except Exception:
+                ssh_pool.discard(client)
+                raise
+            ssh_pool.release(ip, username, client)
 
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            db_manager.add_backup(device_id, timestamp, config_output)
+            if errors:
+                raise IOError(errors.decode('utf-8'))
+            config_output = output.decode('utf-8')
 
-            self.logger.info(f"Configuration for device ID {device_id} saved to database.")
-            self.success.emit(device_id, config_output)
+            timestamp = now_str()
+            # The pool thread is free as soon as the row is queued; the result is reported
+            # once the writer has committed it, so listeners reloading the history see it.
+            saved = backup_writer.enqueue(device_id, timestamp, config_output)
+            saved.add_done_callback(lambda future: self._on_saved(future, device_id, config_output))
+            saving = True
 
         except Exception as e:
-            err_msg = f"An error occurred: {e}"
-            self.logger.error(f"Failed backup for device ID {device_id}. {err_msg}")
-            self.error.emit(device_id, err_msg)
+            self._fail(device_id, e)
 
         finally:
-            self.finished.emit()
\ No newline at end of file
+            if not saving:
+                self.finished.emit()
+
+    def _on_saved(self, future, device_id, config_output):
+        """Runs on the writer thread once the backup row is committed (or failed to be)."""
+        try:
+            error = future.exception()
+            if error is None:
+                self.logger.info(f"Configuration for device ID {device_id} saved to database.")
+                self.success.emit(device_id, config_output)
+            else:
+                self._fail(device_id, error)
+        finally:
+            self.finished.emit()
+
+    def _fail(self, device_id, e):
+        err_msg = f"An error occurred: {e}"
+        self.logger.error(f"Failed backup for device ID {device_id}. {err_msg}")
+        self.error.emit(device_id, err_msg)
+
+
+class SSHBackupTask(QRunnable):
+    """
+    Runs one SSHWorker's backup on the shared SSH pool; the worker's signals carry the result.
+    Submit with `ssh_thread_pool().start(task)` instead of creating a QThread per device.
+    """
+
+    def __init__(self, worker: SSHWorker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run_backup()
+
+
+_ssh_pool = None
+
+
+def ssh_thread_pool() -> QThreadPool:
+    """
+    Returns the bounded thread pool used for SSH backups.
+    Its size comes from the "backup_concurrency" setting, so a backup of every device
+    runs a few sessions at a time on reused threads rather than one new thread each.
+    """
+    global _ssh_pool
+    if _ssh_pool is None:
+        _ssh_pool = QThreadPool()
+        _ssh_pool.setMaxThreadCount(int(AppConfig.get_setting("backup_concurrency", 8)))
+    return _ssh_pool
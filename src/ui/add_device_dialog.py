@@ -15,11 +15,21 @@ class AddDeviceDialog(QDialog):
     def __init__(self, parent=None, device_data=None):
         super().__init__(parent)
 
+        self.device_data = device_data
         self.is_edit_mode = device_data is not None
         title = "Edit Device" if self.is_edit_mode else "Add New Device"
         self.setWindowTitle(title)
         self.setMinimumWidth(400)
+        # The form is built the first time the dialog is shown, not on construction.
+        self._built = False
 
+    def setVisible(self, visible):
+        # show() and exec() both come through here, before the dialog is sized.
+        if visible and not self._built:
+            self._build_ui()
+        super().setVisible(visible)
+
+    def _build_ui(self):
         # --- Form Widgets ---
         self.name_input = QLineEdit()
         self.ip_input = QLineEdit()
@@ -67,13 +77,16 @@ class AddDeviceDialog(QDialog):
 
         # --- Pre-fill data if in edit mode ---
         if self.is_edit_mode:
-            self.name_input.setText(device_data.get("name", ""))
-            self.ip_input.setText(device_data.get("ip", ""))
-            self.model_input.setText(device_data.get("model", ""))
-            self.status_combo.setCurrentText(device_data.get("status", "Unknown"))
-            self.username_input.setText(device_data.get("username", ""))
-            self.password_input.setText(device_data.get("password", ""))
-            self.snmp_input.setText(device_data.get("snmp_community", ""))
+            data = self.get_data()
+            self.name_input.setText(data["name"])
+            self.ip_input.setText(data["ip"])
+            self.model_input.setText(data["model"])
+            self.status_combo.setCurrentText(data["status"])
+            self.username_input.setText(data["username"])
+            self.password_input.setText(data["password"])
+            self.snmp_input.setText(data["snmp_community"])
+
+        self._built = True
 
     def accept(self):
         if not self.name_input.text() or not self.ip_input.text():
@@ -82,6 +95,18 @@ class AddDeviceDialog(QDialog):
         super().accept()
 
     def get_data(self):
+        if not self._built:
+            # Never shown: report the values the form would have been filled with.
+            data = self.device_data or {}
+            return {
+                "name": data.get("name", ""),
+                "ip": data.get("ip", ""),
+                "model": data.get("model", ""),
+                "status": data.get("status", "Unknown") if self.is_edit_mode else "Online",
+                "username": data.get("username", ""),
+                "password": data.get("password", ""),
+                "snmp_community": data.get("snmp_community", ""),
+            }
         return {
             "name": self.name_input.text(),
             "ip": self.ip_input.text(),
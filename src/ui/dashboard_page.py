@@ -6,17 +6,20 @@
 # - Stat cards and the donut chart are now instance variables to be updated dynamically.
 # - The DonutChartWidget has a new `set_values` method to accept live data.
 
+from itertools import accumulate
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy,
-    QPushButton, QGridLayout, QGraphicsDropShadowEffect
+    QPushButton, QGridLayout
 )
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, Property, QEasingCurve, Signal
-from PySide6.QtGui import QFont, QColor, QPainter, QPen, QConicalGradient
+from PySide6.QtCore import Qt, QSize, QPropertyAnimation, Property, QEasingCurve, Signal, QTimer
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QConicalGradient, QPixmap
 
 # --- NEW: Import the database manager ---
-from utils.database import db_manager
+from utils.database import DeviceStatus, db_manager
 from utils.logger import app_logger
 from ui.icon_manager import IconManager
+from ui.shadow import draw_shadow
 
 class DonutChartWidget(QWidget):
     """A custom, animated donut chart widget."""
@@ -24,6 +27,11 @@ class DonutChartWidget(QWidget):
         super().__init__(parent)
         self.setMinimumHeight(250)
         self.values = []
+        self._segments = []          # (offset, span) in 1/16 degrees, gradient start colour, end colour
+        self._center_text = ""
+        self._cached_pixmap = None   # the finished chart, reused until values or size change
+        self._value_font = QFont("Roboto", 24, QFont.Bold)
+        self._label_font = QFont("Roboto", 12, QFont.Normal)
         self._animation_progress = 0
         self.animation = QPropertyAnimation(self, b"animationProgress", self)
         self.animation.setDuration(1000)
@@ -32,6 +40,22 @@ class DonutChartWidget(QWidget):
     def set_values(self, values: list):
         """Sets the data for the chart and restarts the animation."""
         self.values = values
+        # Everything that depends only on the values is worked out here, once, not on every frame.
+        total_value = sum(item['value'] for item in values)
+        if total_value:
+            # Spans and their running offsets are computed in Qt's 1/16-degree units, so a frame
+            # only scales them by the animation progress, however many segments there are.
+            spans = [item['value'] * 5760 / total_value for item in values]
+            self._segments = [
+                (offset, span, item["color"].lighter(120), item["color"])
+                for offset, span, item in zip(accumulate(spans, initial=0), spans, values)
+            ]
+            # Inner text for the largest segment (usually "Online")
+            online_value = next((item['value'] for item in values if item['label'] == 'Online'), 0)
+            self._center_text = f"{(online_value / total_value) * 100:.0f}%"
+        else:
+            self._segments = [] # Avoid division by zero
+        self._cached_pixmap = None
         self.animation.stop()
         self.animation.setStartValue(0.0)
         self.animation.setEndValue(1.0)
@@ -47,39 +71,50 @@ class DonutChartWidget(QWidget):
         self._animation_progress = value
         self.update()
 
+    def resizeEvent(self, event):
+        self._cached_pixmap = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
-        if not self.values:
+        if not self._segments:
             return
         painter = QPainter(self)
+        if self._animation_progress < 1.0:
+            self._draw_chart(painter)
+            return
+        # Steady state: draw once into a pixmap, then every repaint is a single blit.
+        if self._cached_pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            pixmap_painter = QPainter(pixmap)
+            self._draw_chart(pixmap_painter)
+            pixmap_painter.end()
+            self._cached_pixmap = pixmap
+        painter.drawPixmap(0, 0, self._cached_pixmap)
+
+    def _draw_chart(self, painter):
         painter.setRenderHint(QPainter.Antialiasing)
         side = min(self.width(), self.height())
         rect = self.rect().adjusted(side / 4, side / 4, -side / 4, -side / 4)
         pen_width = 25
-        painter.setPen(Qt.NoPen)
-        total_value = sum(item['value'] for item in self.values)
-        if total_value == 0: return # Avoid division by zero
-        start_angle = 90 * 16
-        for item in self.values:
-            angle = (item['value'] / total_value) * 360
-            span_angle = -angle * 16 * self._animation_progress
+        progress = self._animation_progress
+        for offset, span, light_color, color in self._segments:
+            start_angle = 90 * 16 - offset * progress
+            span_angle = -span * progress
             gradient = QConicalGradient(rect.center(), start_angle / 16)
-            gradient.setColorAt(0, item["color"].lighter(120))
-            gradient.setColorAt(1, item["color"])
+            gradient.setColorAt(0, light_color)
+            gradient.setColorAt(1, color)
             pen = QPen(gradient, pen_width)
             pen.setCapStyle(Qt.RoundCap)
             painter.setPen(pen)
             painter.drawArc(rect, int(start_angle), int(span_angle))
-            start_angle += span_angle
         
-        # Draw inner text for the largest segment (usually "Online")
-        online_value = next((item['value'] for item in self.values if item['label'] == 'Online'), 0)
-        percentage = (online_value / total_value) * 100 if total_value > 0 else 0
-        font = QFont("Roboto", 24, QFont.Bold)
-        painter.setFont(font)
+        painter.setFont(self._value_font)
         painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(rect, Qt.AlignCenter, f"{percentage:.0f}%")
-        font.setPointSize(12); font.setWeight(QFont.Normal)
-        painter.setFont(font)
+        painter.drawText(rect, Qt.AlignCenter, self._center_text)
+        painter.setFont(self._label_font)
         painter.setPen(QColor("#9EB0C8"))
         painter.drawText(rect.translated(0, 40), Qt.AlignCenter, "Online")
 
@@ -91,7 +126,7 @@ class CardWidget(QFrame):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred); self.setCursor(Qt.PointingHandCursor)
         layout = QHBoxLayout(self); layout.setSpacing(15)
         if icon_name:
-            self.icon_label = QLabel(); self.icon_label.setPixmap(IconManager.get_icon(icon_name).pixmap(36, 36)); layout.addWidget(self.icon_label)
+            self.icon_label = QLabel(); self.icon_label.setPixmap(IconManager.get_pixmap(icon_name, 36, 36)); layout.addWidget(self.icon_label)
         text_layout = QVBoxLayout(); text_layout.setSpacing(5)
         self.value_label = QLabel(str(value)); self.value_label.setObjectName("cardValue")
         self.title_label = QLabel(title); self.title_label.setObjectName("cardTitle")
@@ -99,7 +134,6 @@ class CardWidget(QFrame):
         if subtext:
             self.subtext_label = QLabel(subtext); self.subtext_label.setObjectName("cardSubtext"); text_layout.addWidget(self.subtext_label)
         layout.addLayout(text_layout); layout.addStretch()
-        shadow = QGraphicsDropShadowEffect(self); shadow.setBlurRadius(30); shadow.setColor(QColor(0, 0, 0, 80)); shadow.setOffset(0, 4); self.setGraphicsEffect(shadow)
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton: self.clicked.emit()
         super().mousePressEvent(event)
@@ -112,8 +146,12 @@ class DashboardPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("dashboardPage")
+        self._shadowed = [] # Cards and panels whose drop shadows this page paints beneath them
         main_layout = QVBoxLayout(self); main_layout.setContentsMargins(30, 30, 30, 30); main_layout.setSpacing(25)
         self._create_widgets()
+        # Coalesces bursts of refresh requests (repeated clicks, page switches) into one query
+        self._refresh_timer = QTimer(self); self._refresh_timer.setSingleShot(True); self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         header_layout = QHBoxLayout()
         title_label = QLabel("Dashboard Overview"); title_label.setObjectName("pageTitle")
         refresh_button = QPushButton("Refresh"); refresh_button.setIcon(IconManager.get_icon("refresh")); refresh_button.setObjectName("outlineButton")
@@ -128,7 +166,7 @@ class DashboardPage(QWidget):
         bottom_layout.addWidget(self._create_activity_panel(), 5)
         bottom_layout.addWidget(self._create_summary_panel(), 4)
         main_layout.addLayout(bottom_layout); main_layout.addStretch()
-        self.refresh_data() # Initial data load
+        self._do_refresh() # Initial data load
 
     def _create_widgets(self):
         """Creates the main widgets and stores them as instance variables."""
@@ -141,18 +179,28 @@ class DashboardPage(QWidget):
         self.card_backups = CardWidget("Backups OK", "0", " ", "backup_ok")
         self.card_backups.clicked.connect(lambda: self.card_clicked.emit(""))
         self.donut_chart = DonutChartWidget()
+        self._shadowed += [self.card_total_devices, self.card_online, self.card_alerts, self.card_backups]
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        for widget in self._shadowed:
+            if widget.isVisible(): draw_shadow(painter, widget.geometry())
 
     def refresh_data(self):
-        """Fetches data from the database and updates the dashboard widgets."""
+        """Schedules a dashboard refresh; calls within 150 ms of each other share one."""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Fetches the counts from the database and updates the dashboard widgets."""
         app_logger.get_logger().info("Refreshing dashboard data...")
         try:
-            devices = db_manager.get_all_devices()
-            total_devices = len(devices)
-            online_count = len([d for d in devices if d['status'] == 'Online'])
-            warning_count = len([d for d in devices if d['status'] == 'Warning'])
-            offline_count = len([d for d in devices if d['status'] == 'Offline'])
+            status_counts, backups_ok_count = db_manager.get_device_summary()
+            total_devices = sum(status_counts.values())
+            online_count = status_counts[DeviceStatus.ONLINE]
+            warning_count = status_counts[DeviceStatus.WARNING]
+            offline_count = status_counts[DeviceStatus.OFFLINE]
             critical_count = warning_count + offline_count
-            backups_ok_count = len([d for d in devices if 'Never' not in d['last_backup']])
 
             # Update stat cards
             self.card_total_devices.set_value(total_devices)
@@ -162,9 +210,9 @@ class DashboardPage(QWidget):
 
             # Update donut chart
             chart_values = [
-                {"label": "Online", "value": online_count, "color": QColor("#00E5FF")},
-                {"label": "Warning", "value": warning_count, "color": QColor("#FFC107")},
-                {"label": "Offline", "value": offline_count, "color": QColor("#F44336")}
+                {"label": DeviceStatus.ONLINE.label, "value": online_count, "color": QColor("#00E5FF")},
+                {"label": DeviceStatus.WARNING.label, "value": warning_count, "color": QColor("#FFC107")},
+                {"label": DeviceStatus.OFFLINE.label, "value": offline_count, "color": QColor("#F44336")}
             ]
             self.donut_chart.set_values(chart_values)
 
@@ -185,7 +233,7 @@ class DashboardPage(QWidget):
     def _create_panel(self, title):
         panel = QFrame(); panel.setObjectName("PanelWidget"); layout = QVBoxLayout(panel)
         layout.setContentsMargins(25, 20, 25, 25); layout.setSpacing(15); header = QLabel(title); header.setObjectName("panelTitle")
-        layout.addWidget(header); shadow = QGraphicsDropShadowEffect(self); shadow.setBlurRadius(30); shadow.setColor(QColor(0, 0, 0, 80)); shadow.setOffset(0, 4); panel.setGraphicsEffect(shadow)
+        layout.addWidget(header); self._shadowed.append(panel)
         return panel, layout
     def _create_activity_panel(self):
         panel, layout = self._create_panel("Recent Activity")
@@ -196,7 +244,7 @@ class DashboardPage(QWidget):
         self._add_activity_item(layout, "add", "New Device Added", "Access Switch Floor 5", "Yesterday, 18:47")
         layout.addStretch(); return panel
     def _add_activity_item(self, layout, icon_name, title, subtitle, time):
-        item_layout = QHBoxLayout(); item_layout.setSpacing(15); icon_label = QLabel(); icon_label.setPixmap(IconManager.get_icon(icon_name).pixmap(24, 24)); icon_label.setObjectName("activityIcon")
+        item_layout = QHBoxLayout(); item_layout.setSpacing(15); icon_label = QLabel(); icon_label.setPixmap(IconManager.get_pixmap(icon_name, 24, 24)); icon_label.setObjectName("activityIcon")
         text_layout = QVBoxLayout(); text_layout.setSpacing(2); title_label = QLabel(title); title_label.setObjectName("activityTitle"); subtitle_label = QLabel(subtitle); subtitle_label.setObjectName("activitySubtext")
         text_layout.addWidget(title_label); text_layout.addWidget(subtitle_label); time_label = QLabel(time); time_label.setObjectName("activityTime"); time_label.setAlignment(Qt.AlignRight | Qt.AlignTop)
         item_layout.addWidget(icon_label); item_layout.addLayout(text_layout); item_layout.addStretch(); item_layout.addWidget(time_label); layout.addLayout(item_layout)
@@ -6,60 +6,244 @@ import datetime
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton,
-    QGridLayout, QTableWidget, QTextEdit, QTabWidget, QHeaderView,
-    QTableWidgetItem, QGraphicsDropShadowEffect, QAbstractItemView, QMessageBox
+    QGridLayout, QTableView, QTextEdit, QTabWidget, QHeaderView,
+    QGraphicsDropShadowEffect, QAbstractItemView, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, QPointF, QThread
-from PySide6.QtGui import QColor, QFont, QPainter, QPen, QLinearGradient, QPainterPath
+from PySide6.QtCore import Qt, Signal, QPointF, QLineF, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QLinearGradient, QPainterPath, QIcon, QPixmap
 from PySide6.QtWidgets import QFileDialog
 from ui.icon_manager import IconManager
 from ui.styles import Style
-from utils.database import db_manager
+from utils.database import db_manager, unpack_config
 from utils.logger import app_logger
-from network.snmp_worker import SNMPWorker
+from network.snmp_worker import SNMPWorker, snmp_poller
 from network.ssh_worker import SSHWorker
 from ui.working_dynamic_cpu_graph import WorkingDynamicCPUGraph
 
+_BYTE_UNITS = ((1, "B"), (1 << 10, "KB"), (1 << 20, "MB"), (1 << 30, "GB"), (1 << 40, "TB"))
+
+def _make_status_dot(color: str, size: int = 10) -> QPixmap:
+    """Paints a filled status dot once so table items can share it as their icon."""
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(0, 0, size, size)
+    painter.end()
+    return pixmap
+
+class InterfaceTableModel(QAbstractTableModel):
+    """
+    Backs the interface table. Rows are prepared once per SNMP poll as
+    (cell texts, (oper icon, admin icon), VLAN background or None); the view asks only
+    for the cells it paints. A message (loading/error) replaces the rows while set.
+    """
+    HEADERS = ["INTERFACE", "OPER STATUS", "ADMIN STATUS", "VLAN", "TRAFFIC (IN / OUT)", "POWER"]
+    VLAN_COLUMN = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._message = None
+        self._message_color = None
+
+    def set_rows(self, rows: list):
+        if rows and self._message is None and len(rows) == len(self._rows):
+            # Same port count as what's shown: update in place, keeping the view's rows and scroll position.
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self.HEADERS) - 1))
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self._message = None
+        self.endResetModel()
+
+    def set_message(self, text: str, color: QColor = None):
+        self.beginResetModel()
+        self._rows = []
+        self._message = text
+        self._message_color = color
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        row, column = index.row(), index.column()
+        if self._message is not None:
+            if column != 0:
+                return None
+            if role == Qt.DisplayRole: return self._message
+            if role == Qt.TextAlignmentRole: return Qt.AlignCenter
+            if role == Qt.ForegroundRole: return self._message_color
+            return None
+        cells, icons, vlan_background = self._rows[row]
+        if role == Qt.DisplayRole:
+            return cells[column]
+        if role == Qt.DecorationRole and column in (1, 2):
+            return icons[column - 1]
+        if column == self.VLAN_COLUMN:
+            if role == Qt.TextAlignmentRole: return Qt.AlignCenter
+            if role == Qt.BackgroundRole: return vlan_background
+        return None
+
+class BackupTableModel(QAbstractTableModel):
+    """
+    Backs the backup history table with plain column lists (timestamps, statuses)
+    filled in one pass over the query result; a cell lookup is a list index.
+    The ACTIONS column renders an "Export" link for every row.
+    """
+    HEADERS = ["TIMESTAMP", "STATUS", "ACTIONS"]
+    EXPORT_COLUMN = 2
+
+    def __init__(self, link_color: QColor, link_font: QFont, parent=None):
+        super().__init__(parent)
+        self._timestamps = []
+        self._statuses = []
+        self._link_color = link_color
+        self._link_font = link_font
+
+    def set_backups(self, backups: list):
+        timestamps, statuses = [], []
+        for backup in backups:
+            timestamps.append(backup['timestamp'])
+            statuses.append(backup.get("status", "Success")) # Default to Success if not specified
+        self.beginResetModel()
+        self._timestamps = timestamps
+        self._statuses = statuses
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._timestamps)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0: return self._timestamps[index.row()]
+            if column == 1: return self._statuses[index.row()]
+            return "Export"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter
+        if column == self.EXPORT_COLUMN:
+            if role == Qt.ForegroundRole: return self._link_color
+            if role == Qt.FontRole: return self._link_font
+        return None
+
 class GraphPlaceholder(QWidget):
     """A widget that draws a visually appealing, simulated line graph."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(200)
         self.data_points = [0.2, 0.3, 0.25, 0.4, 0.5, 0.45, 0.6, 0.75, 0.7, 0.8, 0.6, 0.65]
+        self._grid_pen = QPen(QColor(Style.DARK_BORDER)); self._grid_pen.setWidth(1)
+        self._graph_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY)); self._graph_pen.setWidth(2)
+        self._gradient_colors = (QColor(Style.DARK_ACCENT_PRIMARY).lighter(150), QColor(Style.DARK_BG_PRIMARY))
+        # Geometry depends only on the widget size; rebuilt on the first paint after a resize.
+        self._cached_size = None
+        self._grid_lines = []
+        self._line_path = None
+        self._fill_path = None
+        self._fill_gradient = None
+
+    def resizeEvent(self, event):
+        self._cached_size = None
+        super().resizeEvent(event)
+
+    def _rebuild_geometry(self):
+        width, height = self.width(), self.height()
+        num_h_lines = 5
+        self._grid_lines = [QLineF(0, height * i / (num_h_lines + 1), width, height * i / (num_h_lines + 1)) for i in range(1, num_h_lines + 1)]
+        last_index = len(self.data_points) - 1
+        line_path = QPainterPath()
+        for i, val in enumerate(self.data_points):
+            point = QPointF(width * i / last_index, height - (val * height * 0.8) - (height * 0.1))
+            if i == 0: line_path.moveTo(point)
+            else: line_path.lineTo(point)
+        # The fill is the line closed down to the baseline at both ends (x = 0 and x = width).
+        fill_path = QPainterPath(QPointF(0, height)); fill_path.connectPath(line_path); fill_path.lineTo(width, height)
+        self._line_path = line_path; self._fill_path = fill_path
+        top_color, bottom_color = self._gradient_colors
+        self._fill_gradient = QLinearGradient(0, 0, 0, height); self._fill_gradient.setColorAt(0.0, top_color); self._fill_gradient.setColorAt(1.0, bottom_color)
+        self._cached_size = self.size()
 
     def paintEvent(self, event):
+        if self._cached_size != self.size():
+            self._rebuild_geometry()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        grid_pen = QPen(QColor(Style.DARK_BORDER)); grid_pen.setWidth(1); painter.setPen(grid_pen)
-        num_h_lines = 5
-        for i in range(1, num_h_lines + 1):
-            y = self.height() * i / (num_h_lines + 1)
-            painter.drawLine(0, y, self.width(), y)
-        graph_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY)); graph_pen.setWidth(2); painter.setPen(graph_pen)
-        points = [QPointF(self.width() * i / (len(self.data_points) - 1), self.height() - (val * self.height() * 0.8) - (self.height() * 0.1)) for i, val in enumerate(self.data_points)]
-        painter.drawPolyline(points)
-        gradient = QLinearGradient(0, 0, 0, self.height()); gradient.setColorAt(0.0, QColor(Style.DARK_ACCENT_PRIMARY).lighter(150)); gradient.setColorAt(1.0, QColor(Style.DARK_BG_PRIMARY)); painter.setBrush(gradient); painter.setPen(Qt.NoPen)
-        fill_path = QPainterPath(); fill_path.moveTo(points[0].x(), self.height())
-        for p in points: fill_path.lineTo(p)
-        fill_path.lineTo(points[-1].x(), self.height()); painter.drawPath(fill_path)
+        painter.setPen(self._grid_pen); painter.drawLines(self._grid_lines)
+        painter.setPen(self._graph_pen); painter.setBrush(Qt.NoBrush); painter.drawPath(self._line_path)
+        painter.setBrush(self._fill_gradient); painter.setPen(Qt.NoPen); painter.drawPath(self._fill_path)
 
 import paramiko
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QThread
+
+class FileWriteWorker(QObject):
+    """Writes a text file on a worker thread so large exports don't block painting."""
+    finished = Signal(bool, str)  # success, error message
+
+    def __init__(self, file_path: str, text: str):
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+
+    def run(self):
+        try:
+            with open(self.file_path, "w", encoding="utf-8") as f:
+                f.write(self.text)
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
 
 class DeviceDetailPage(QWidget):
     back_clicked = Signal()
 
+    INTERFACE_STATUS_TEXT = {1: "Up", 2: "Down", 3: "Testing"}
+    # Colors are parsed once here rather than on every load or table refresh.
+    _DEVICE_STATUS_COLORS = {"Online": Style.STATUS_GREEN, "Warning": Style.STATUS_YELLOW, "Offline": Style.STATUS_RED}
+    _VLAN_TINT = QColor(Style.DARK_ACCENT_PRIMARY).lighter(170)
+    _ERROR_COLOR = QColor(Style.STATUS_RED)
+    _LINK_COLOR = QColor(Style.DARK_ACCENT_PRIMARY)
+    _status_icons = None  # ifOperStatus/ifAdminStatus code -> QIcon, built on first use
+    INTERFACES_TAB, BACKUP_HISTORY_TAB, CONFIG_TAB = 1, 2, 3
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("deviceDetailPage")
         self.current_device_id = None
         self.current_device_info = {} # Store full device info
         self.backups = []
-        self.snmp_thread = None # To manage the SNMP worker thread
+        self.snmp_worker = None # The SNMP poll in progress, kept alive until it finishes
+        self._snmp_future = None
+        self._interfaces_shown_for = None # Device whose interfaces are currently in the table
+        # Quick device switches share one SNMP query for the device that ends up shown.
+        self._snmp_debounce_timer = QTimer(self); self._snmp_debounce_timer.setSingleShot(True); self._snmp_debounce_timer.setInterval(200)
+        self._snmp_debounce_timer.timeout.connect(self._actually_load_interface_data)
         self._backup_thread = None
         self._backup_worker = None
         self._reboot_thread = None
         self._reboot_worker = None
+        self._export_thread = None # (QThread, FileWriteWorker) while an export is being written
 
         main_layout = QVBoxLayout(self); main_layout.setContentsMargins(30, 30, 30, 30); main_layout.setSpacing(25)
         header_layout = self._create_header(); main_layout.addLayout(header_layout)
@@ -83,11 +267,7 @@ class DeviceDetailPage(QWidget):
         self.model_card_val.setText(device_info.get("model", "N/A"))
         self.snmp_card_val.setText(device_info.get("snmp_community", "N/A"))
 
-        status_color = {
-            "Online": Style.STATUS_GREEN,
-            "Warning": Style.STATUS_YELLOW,
-            "Offline": Style.STATUS_RED,
-        }.get(device_info.get("status"), Style.DARK_TEXT_SECONDARY)
+        status_color = self._DEVICE_STATUS_COLORS.get(device_info.get("status"), Style.DARK_TEXT_SECONDARY)
         self.status_card_val.setStyleSheet(f"color: {status_color};")
         
         # Handle CPU graph safely and START monitoring
@@ -104,8 +284,11 @@ class DeviceDetailPage(QWidget):
             except Exception as e:
                 app_logger.get_logger().error(f"Failed to start CPU graph monitoring: {e}")
 
-        self._load_backup_history()
-        self._load_interface_data()
+        # Interfaces and backups are only fetched once their tab is shown.
+        self._interfaces_stale = True
+        self._backups_stale = True
+        self._snmp_debounce_timer.stop() # A query queued for the previous device is no longer wanted
+        self._load_stale_tab(self.details_tabs.currentIndex())
         app_logger.get_logger().debug(f"Loaded details for device: {device_info.get('name', 'N/A')}")
 
     def _create_header(self):
@@ -134,7 +317,7 @@ class DeviceDetailPage(QWidget):
         
     def _create_info_card(self, parent_layout, icon_name, label_text, value_text):
         card = QFrame(); card.setObjectName("InfoCard"); layout = QHBoxLayout(card); layout.setSpacing(15)
-        icon = QLabel(); icon.setPixmap(IconManager.get_icon(icon_name).pixmap(24,24))
+        icon = QLabel(); icon.setPixmap(IconManager.get_pixmap(icon_name, 24, 24))
         text_layout = QVBoxLayout(); text_layout.setSpacing(2)
         label = QLabel(label_text); label.setObjectName("infoCardLabel")
         value = QLabel(value_text); value.setObjectName("infoCardValue")
@@ -159,15 +342,55 @@ class DeviceDetailPage(QWidget):
     
         perf_layout.addStretch()
 
+        # The other tabs start as empty pages; their contents are built the first time they are shown.
+        interfaces_tab = QWidget(); QVBoxLayout(interfaces_tab).setContentsMargins(0, 10, 0, 0)
+        backup_history_tab = QWidget(); QVBoxLayout(backup_history_tab).setContentsMargins(0, 10, 0, 0)
+        config_tab = QWidget(); QVBoxLayout(config_tab).setContentsMargins(0, 0, 0, 0)
+        self._tab_pages = [performance_tab, interfaces_tab, backup_history_tab, config_tab]
+        self._tab_built = [True, False, False, False]
+        self._interfaces_stale = False # A device was loaded but its interfaces haven't been queried yet
+        self._backups_stale = False
+
+        tabs.addTab(performance_tab, IconManager.get_icon("chip"), "Live Performance")
+        tabs.addTab(interfaces_tab, IconManager.get_icon("interfaces"), "Interfaces")
+        tabs.addTab(backup_history_tab, IconManager.get_icon("backup_ok"), "Backup History")
+        tabs.addTab(config_tab, IconManager.get_icon("view"), "View Configuration")
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self.details_tabs = tabs
+        return tabs
+
+    def _on_tab_changed(self, index: int):
+        self._ensure_tab_built(index)
+        self._load_stale_tab(index)
+
+    def _ensure_tab_built(self, index: int):
+        if self._tab_built[index]:
+            return
+        if index == self.INTERFACES_TAB:
+            self._build_interfaces_tab()
+        else:
+            # The history table and the config viewer work together, so they are built as a pair.
+            self._build_backup_tabs()
+            self._tab_built[self.BACKUP_HISTORY_TAB] = self._tab_built[self.CONFIG_TAB] = True
+        self._tab_built[index] = True
+
+    def _load_stale_tab(self, index: int):
+        """Loads the current device's data into the tab being shown, if it hasn't been yet."""
+        if index == self.INTERFACES_TAB and self._interfaces_stale:
+            self._interfaces_stale = False
+            self._load_interface_data()
+        elif index in (self.BACKUP_HISTORY_TAB, self.CONFIG_TAB) and self._backups_stale:
+            self._backups_stale = False
+            self._load_backup_history()
+
+    def _build_interfaces_tab(self):
         # Interfaces Tab - UPDATED to show VLAN instead of Uptime
-        interfaces_tab = QWidget()
-        if_layout = QVBoxLayout(interfaces_tab)
-        if_layout.setContentsMargins(0, 10, 0, 0)
-        self.interface_table = QTableWidget()
+        if_layout = self._tab_pages[self.INTERFACES_TAB].layout()
+        # Model/view: cells are painted from the model, with no per-cell widgets or items.
+        self.interface_model = InterfaceTableModel(self)
+        self.interface_table = QTableView()
         self.interface_table.setObjectName("devicesTable")
-        self.interface_table.setColumnCount(6)
-        # UPDATED: Changed "UPTIME" to "VLAN"
-        self.interface_table.setHorizontalHeaderLabels(["INTERFACE", "OPER STATUS", "ADMIN STATUS", "VLAN", "TRAFFIC (IN / OUT)", "POWER"])
+        self.interface_table.setModel(self.interface_model)
 
         # Set column resize modes for interfaces table
         header = self.interface_table.horizontalHeader()
@@ -190,15 +413,15 @@ class DeviceDetailPage(QWidget):
 
         if_layout.addWidget(self.interface_table)
 
+    def _build_backup_tabs(self):
         # Backup History Tab - ENHANCED UI
-        backup_history_tab = QWidget()  # Create a container widget for the backup history
-        backup_layout = QVBoxLayout(backup_history_tab)
-        backup_layout.setContentsMargins(0, 10, 0, 0)  # Adjust margins for the tab content
+        backup_layout = self._tab_pages[self.BACKUP_HISTORY_TAB].layout()
 
-        self.backup_table = QTableWidget()
+        self.backup_table = QTableView()
         self.backup_table.setObjectName("backupTable")  # Set object name for styling
-        self.backup_table.setColumnCount(3)
-        self.backup_table.setHorizontalHeaderLabels(["TIMESTAMP", "STATUS", "ACTIONS"])
+        link_font = QFont(self.backup_table.font()); link_font.setUnderline(True)
+        self.backup_model = BackupTableModel(self._LINK_COLOR, link_font, self)
+        self.backup_table.setModel(self.backup_model)
         self.backup_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)  # TIMESTAMP
         self.backup_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)  # STATUS
         self.backup_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)  # ACTIONS
@@ -225,147 +448,128 @@ class DeviceDetailPage(QWidget):
         self.backup_table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.backup_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
+        self.backup_table.clicked.connect(self._on_backup_cell_clicked)
+
         backup_layout.addWidget(self.backup_table)
 
         # View Configuration Tab
         self.config_text_edit = QTextEdit()
         self.config_text_edit.setReadOnly(True)
         self.config_text_edit.setObjectName("configText")
-
-        tabs.addTab(performance_tab, IconManager.get_icon("chip"), "Live Performance")
-        tabs.addTab(interfaces_tab, IconManager.get_icon("interfaces"), "Interfaces")
-        tabs.addTab(backup_history_tab, IconManager.get_icon("backup_ok"), "Backup History")
-        tabs.addTab(self.config_text_edit, IconManager.get_icon("view"), "View Configuration")
-        return tabs
+        self._tab_pages[self.CONFIG_TAB].layout().addWidget(self.config_text_edit)
 
     def _load_backup_history(self):
-        self.backup_table.setRowCount(0); self.config_text_edit.clear()
+        self.backup_model.set_backups([]); self.config_text_edit.clear()
         if self.current_device_id is None: return
         self.backups = db_manager.get_backups_for_device(self.current_device_id)
         if not self.backups: self.config_text_edit.setPlaceholderText("No backups found for this device."); return
         
-        self.backup_table.setRowCount(len(self.backups))
-        for row, backup in enumerate(self.backups):
-            # Column 0: Timestamp
-            timestamp_item = QTableWidgetItem(backup['timestamp'])
-            timestamp_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            self.backup_table.setItem(row, 0, timestamp_item)
-            
-            # Column 1: Status (using custom widget with indicator)
-            status_text = backup.get("status", "Success") # Default to Success if not specified
-            status_item = QTableWidgetItem(status_text)
-            status_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self.backup_table.setItem(row, 1, status_item)
-            
-            # Column 2: Actions (using a hyperlink)
-            export_link = QLabel('<a href="#">Export</a>')
-            export_link.setOpenExternalLinks(False)
-            export_link.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            export_link.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            export_link.linkActivated.connect(lambda _, r=row: self._export_backup_config(r))
-            self.backup_table.setCellWidget(row, 2, export_link)
+        self.backup_model.set_backups(self.backups)
 
         # Automatically show the latest backup config if available
         if self.backups: self._show_backup_config(0)
         app_logger.get_logger().debug(f"Loaded backup history for device ID: {self.current_device_id}")
 
+    def _on_backup_cell_clicked(self, index: QModelIndex):
+        if index.column() == BackupTableModel.EXPORT_COLUMN:
+            self._export_backup_config(index.row())
+
     def _load_interface_data(self):
-        """Initiates the background SNMP query for interface data."""
+        """Shows the loading message and schedules the SNMP query; calls within 200 ms share one."""
         app_logger.get_logger().info(f"_load_interface_data called for device: {self.current_device_info}")
-        
-        if getattr(self, "snmp_thread", None) and self.snmp_thread.isRunning():
-            return # A query is already in progress
-        
+
+        # Show a loading message, unless this device's interfaces are already shown and just refreshing
+        if self._interfaces_shown_for != self.current_device_id:
+            self.interface_model.set_message("Fetching interface data via SNMP...")
+            self.interface_table.setSpan(0, 0, 1, self.interface_model.columnCount())
+        self._snmp_debounce_timer.start()
+
+    def _actually_load_interface_data(self):
+        """Initiates the background SNMP query for interface data."""
+        if self.snmp_worker is not None:
+            self._abandon_snmp_query() # Still polling a device that is no longer shown
+
         app_logger.get_logger().info(f"Device info keys: {list(self.current_device_info.keys())}")
-        
-        # Show a loading message
-        self.interface_table.setRowCount(1)
-        loading_item = QTableWidgetItem("Fetching interface data via SNMP...")
-        loading_item.setTextAlignment(Qt.AlignCenter)
-        self.interface_table.setItem(0, 0, loading_item)
-        self.interface_table.setSpan(0, 0, 1, self.interface_table.columnCount())
         app_logger.get_logger().debug(f"Initiating SNMP data load for device: {self.current_device_info.get('ip', 'N/A')}")
 
         app_logger.get_logger().info(f"Creating SNMP worker with device info: {self.current_device_info}")
         
-        self.snmp_thread = QThread()
+        # The poll runs on the shared SNMP poller loop; its signals are queued back to this thread.
         worker = SNMPWorker(self.current_device_info)
-        worker.moveToThread(self.snmp_thread)
-
         worker.success.connect(self._on_snmp_success)
         worker.error.connect(self._on_snmp_error)
-        worker.finished.connect(self.snmp_thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        self.snmp_thread.finished.connect(self.snmp_thread.deleteLater)
-        self.snmp_thread.finished.connect(lambda: setattr(self, "snmp_thread", None))
-        
-        self.snmp_thread.started.connect(worker.run)
-        self.snmp_thread.start()
+        worker.finished.connect(self._on_snmp_finished)
+        self.snmp_worker = worker
+        self._snmp_future = snmp_poller.submit(worker)
         
-        app_logger.get_logger().info("SNMP thread started successfully")
+        app_logger.get_logger().info("SNMP poll submitted successfully")
+
+    def _abandon_snmp_query(self):
+        """Detaches the in-flight poll so its results can't land in the table, then cancels it."""
+        worker = self.snmp_worker
+        worker.success.disconnect(self._on_snmp_success)
+        worker.error.disconnect(self._on_snmp_error)
+        worker.finished.disconnect(self._on_snmp_finished)
+        self._snmp_future.cancel()
+        self.snmp_worker = None
+        self._snmp_future = None
+
+    def _on_snmp_finished(self):
+        self.snmp_worker = None
+        self._snmp_future = None
 
     def _on_snmp_success(self, interfaces: list):
         """Populates the interface table upon successful SNMP query."""
-        self.interface_table.setRowCount(0) # Clear loading message
         if not interfaces:
             self._on_snmp_error("No interfaces found or device did not respond.")
             app_logger.get_logger().warning(f"No SNMP interfaces found for device {self.current_device_info.get('ip', 'N/A')}.")
             return
 
-        self.interface_table.setRowCount(len(interfaces))
-        for row, iface in enumerate(interfaces):
-            # Column 0: Interface Name
-            self.interface_table.setItem(row, 0, QTableWidgetItem(iface['Description']))
-            # Column 1: Operational Status
-            self.interface_table.setCellWidget(row, 1, self._create_status_widget(iface['OpStatus']))
-            # Column 2: Admin Status
-            self.interface_table.setCellWidget(row, 2, self._create_status_widget(iface['AdminStatus'], admin=True))
-            # Column 3: VLAN (UPDATED: Changed from Uptime to VLAN)
-            vlan_info = iface.get("VLAN", "N/A")
-            vlan_item = QTableWidgetItem(str(vlan_info))
-            vlan_item.setTextAlignment(Qt.AlignCenter)
-            # Color code VLAN cells for better visibility
-            if vlan_info != "N/A" and str(vlan_info).isdigit():
-                # Give VLAN cells a subtle background color
-                vlan_item.setBackground(QColor(Style.DARK_ACCENT_PRIMARY).lighter(170))
-            self.interface_table.setItem(row, 3, vlan_item)
-            # Column 4: Traffic
-            traffic_text = f"{self._format_bytes(iface['InOctets'])} / {self._format_bytes(iface['OutOctets'])}"
-            self.interface_table.setItem(row, 4, QTableWidgetItem(traffic_text))
-            # Column 5: Power
-            power_status = iface.get("Power", "N/A")
-            self.interface_table.setItem(row, 5, QTableWidgetItem(str(power_status)))
+        # Classify and format column by column first, with the lookups bound to locals.
+        fmt = self._format_bytes
+        status_text = self.INTERFACE_STATUS_TEXT.get
+        status_icon = self._status_icon
+        vlan_texts = [str(iface.get("VLAN", "N/A")) for iface in interfaces]
+        # Color code VLAN cells for better visibility
+        vlan_tints = [self._VLAN_TINT if vlan.isdigit() else None for vlan in vlan_texts]
+        # Rates once a previous poll of the same device is available, counter totals before that.
+        traffics = [
+            f"{fmt(iface['InOctets'])} / {fmt(iface['OutOctets'])}" if iface.get('InRate') is None
+            else f"{fmt(iface['InRate'])}/s / {fmt(iface['OutRate'])}/s"
+            for iface in interfaces
+        ]
+        rows = [
+            (
+                (iface['Description'], status_text(iface['OpStatus'], "Unknown"), status_text(iface['AdminStatus'], "Unknown"),
+                 vlan, traffic, str(iface.get("Power", "N/A"))),
+                (status_icon(iface['OpStatus']), status_icon(iface['AdminStatus'])),
+                tint,
+            )
+            for iface, vlan, tint, traffic in zip(interfaces, vlan_texts, vlan_tints, traffics)
+        ]
+        self.interface_table.clearSpans() # Clear loading message
+        self.interface_model.set_rows(rows)
+        self._interfaces_shown_for = self.current_device_id
 
         app_logger.get_logger().debug(f"Successfully loaded {len(interfaces)} interfaces for device {self.current_device_info.get('ip', 'N/A')}")
 
     def _on_snmp_error(self, message: str):
         """Displays an error message in the interface table."""
-        self.interface_table.setRowCount(1)
-        error_item = QTableWidgetItem(f"Error: {message}")
-        error_item.setTextAlignment(Qt.AlignCenter)
-        error_item.setForeground(QColor(Style.STATUS_RED))
-        self.interface_table.setItem(0, 0, error_item)
-        self.interface_table.setSpan(0, 0, 1, self.interface_table.columnCount())
+        self._interfaces_shown_for = None
+        self.interface_model.set_message(f"Error: {message}", self._ERROR_COLOR)
+        self.interface_table.setSpan(0, 0, 1, self.interface_model.columnCount())
         QMessageBox.critical(self, "SNMP Error", message)
         app_logger.get_logger().error(
             f"SNMP interface data load failed for device {self.current_device_info.get('ip', 'N/A')}: {message}"
         )
 
-    def _create_status_widget(self, status_code: int, admin=False):
-        """Creates a colored status indicator widget for the interface table."""
-        status_map = {1: "Up", 2: "Down", 3: "Testing"}
-        color_map = {1: Style.STATUS_GREEN, 2: Style.STATUS_RED, 3: Style.STATUS_YELLOW}
-        
-        text = status_map.get(status_code, "Unknown")
-        color = color_map.get(status_code, Style.DARK_TEXT_DISABLED)
-
-        widget = QWidget(); layout = QHBoxLayout(widget); layout.setContentsMargins(5, 0, 5, 0); layout.setSpacing(8)
-        indicator = QFrame(); indicator.setFixedSize(10, 10)
-        indicator.setStyleSheet(f"background-color: {color}; border-radius: 5px;")
-        label = QLabel(text)
-        
-        layout.addWidget(indicator); layout.addWidget(label); layout.addStretch()
-        return widget
+    @classmethod
+    def _status_icon(cls, status_code: int) -> QIcon:
+        """Returns the shared colored-dot icon for an interface status code."""
+        if cls._status_icons is None:
+            color_map = {1: Style.STATUS_GREEN, 2: Style.STATUS_RED, 3: Style.STATUS_YELLOW, None: Style.DARK_TEXT_DISABLED}
+            cls._status_icons = {code: QIcon(_make_status_dot(color)) for code, color in color_map.items()}
+        return cls._status_icons.get(status_code, cls._status_icons[None])
 
     def _create_backup_status_widget(self, status_text: str):
         """Creates a colored status indicator widget for the backup history table."""
@@ -418,35 +622,14 @@ class DeviceDetailPage(QWidget):
     def _format_bytes(self, num_bytes):
         """Format bytes into human readable format with safety checks."""
         try:
-            # Ensure we have a numeric value
-            if isinstance(num_bytes, str):
-                try:
-                    num_bytes = int(num_bytes)
-                except (ValueError, TypeError):
-                    return "0 B"
-            
-            # Handle None or other non-numeric types
-            if num_bytes is None or not isinstance(num_bytes, (int, float)):
-                return "0 B"
-            
-            # Convert to int if it's a float
-            num_bytes = int(num_bytes)
-            
-            # Format the bytes
-            if num_bytes < 1024:
-                return f"{num_bytes} B"
-            elif num_bytes < 1024**2:
-                return f"{num_bytes/1024:.1f} KB"
-            elif num_bytes < 1024**3:
-                return f"{num_bytes/(1024**2):.1f} MB"
-            elif num_bytes < 1024**4:
-                return f"{num_bytes/(1024**3):.1f} GB"
-            else:
-                return f"{num_bytes/(1024**4):.1f} TB"
-                
-        except Exception as e:
-            app_logger.get_logger().warning(f"Error formatting bytes value '{num_bytes}': {e}")
+            num_bytes = int(num_bytes) # SNMP counters arrive as int or numeric str
+        except (ValueError, TypeError):
             return "0 B"
+        if num_bytes < 1024:
+            return f"{num_bytes} B"
+        # Each unit is 10 more bits, so the unit index falls straight out of the bit length.
+        divisor, unit = _BYTE_UNITS[min((num_bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)]
+        return f"{num_bytes / divisor:.1f} {unit}"
     
     def _show_backup_config(self, index: int):
         """Display the configuration text from the selected backup in the text viewer."""
@@ -455,7 +638,8 @@ class DeviceDetailPage(QWidget):
             return
 
         backup = self.backups[index]
-        config_text = backup.get("configuration", "No configuration available.")
+        stored = backup.get("configuration")
+        config_text = unpack_config(stored) if stored is not None else "No configuration available."
         self.config_text_edit.setPlainText(config_text)
 
     def _export_backup_config(self, index: int):
@@ -465,25 +649,44 @@ class DeviceDetailPage(QWidget):
             return
 
         backup = self.backups[index]
-        config_text = backup.get("configuration", "")
+        stored = backup.get("configuration")
+        config_text = unpack_config(stored) if stored is not None else ""
         default_name = f"{self.current_device_info.get('name', 'backup')}_{backup['timestamp'].replace(':','-').replace(' ', '_')}.txt"
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Export Configuration", default_name, "Text Files (*.txt)")
-        if file_path:
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(config_text)
-                QMessageBox.information(self, "Export Successful", "Backup configuration exported successfully.")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Failed to save file: {e}")
+        if not file_path:
+            return
+        if self._export_thread is not None:
+            QMessageBox.information(self, "Export In Progress", "Please wait for the current export to finish.")
+            return
+
+        thread = QThread()
+        worker = FileWriteWorker(file_path, config_text)
+        worker.moveToThread(thread)
+        worker.finished.connect(self._on_export_finished)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda: setattr(self, '_export_thread', None))
+        thread.started.connect(worker.run)
+        # Strong reference to both
+        self._export_thread = (thread, worker)
+        thread.start()
+
+    def _on_export_finished(self, success: bool, error_message: str):
+        if success:
+            self.window().show_toast("Backup configuration exported successfully.", "success")
+        else:
+            QMessageBox.critical(self, "Export Error", f"Failed to save file: {error_message}")
 
     def _format_ticks(self, ticks_raw: str) -> str:
         """Converts SNMP ticks (1/100ths of seconds) into readable uptime."""
-        try:
-            ticks = int(ticks_raw)
-            seconds = ticks // 100
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
-        except:
-            return "N/A"
\ No newline at end of file
+        if ticks_raw is None:
+            return "N/A"
+        ticks_text = str(ticks_raw).strip()
+        if not ticks_text.isdigit(): # Checked up front rather than by catching int() failures
+            return "N/A"
+        seconds = int(ticks_text) // 100
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}h {minutes}m"
\ No newline at end of file
@@ -1,15 +1,50 @@
 # ui/icon_manager.py
 
 import os
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QPen, QPainterPath, QFont
-from PySide6.QtCore import Qt, QDir, QPointF, QRectF
+from functools import lru_cache
+from typing import Iterable
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QPixmap, QPixmapCache, QPainter, QColor, QPen, QPainterPath, QFont
+from PySide6.QtCore import Qt, QDir, QPointF, QRectF, QThreadPool, QByteArray
+from PySide6.QtSvg import QSvgRenderer
 
 from ui.styles import Style
 
+ICON_CACHE_SIZE = 128       # QIcon wrappers kept alive; the pixmaps behind them live in QPixmapCache
+PIXMAP_CACHE_LIMIT_KB = 4096
+ICON_SIZE = 24              # logical size drawn icons are rasterized at; the nav list shows them at 24x24
+DRAW_SIZE = 32              # the coordinate space the _draw_*_icon methods are written in
+# Drawn icons are rasterized once and kept here as PNGs, outside the install directory,
+# which may be read-only or (in a PyInstaller bundle) a temporary extraction folder.
+ICON_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nmsimple", "icons")
+ICON_CACHE_VERSION = 1      # part of every cached file name; bump when a _draw_*_icon method changes
+
+# Invariant drawing geometry and colors, built once rather than on every draw call.
+_CIRCLE_RECT = QRectF(7, 7, 18, 18)
+_HELP_RECT = QRectF(6, 6, 20, 20)
+_GEAR_RECT = QRectF(8, 8, 16, 16)
+_GREEN = QColor(Style.STATUS_GREEN)
+_RED = QColor(Style.STATUS_RED)
+_YELLOW = QColor(Style.STATUS_YELLOW)
+
+def _make_pen(color: QColor) -> QPen:
+    pen = QPen(color)
+    pen.setWidth(2)
+    pen.setCapStyle(Qt.RoundCap)
+    pen.setJoinStyle(Qt.RoundJoin)
+    return pen
+
 class IconManager:
-    _icons = {}
     _icon_path = ""
+    _cache_path = ""
+    _svg_set = set()     # icon names with an SVG on disk
+    _cached_set = set()  # PNG file names already in the render cache
+    _prewarmed = {}      # PNG file name -> QImage decoded off the GUI thread by prewarm()
+    _svg_source_cache = {}  # icon name -> SVG file bytes, read once for recoloring
     _color = QColor("#00E5FF")
+    _DEFAULT_PEN = _make_pen(_color)
+    # Fonts need a running QGuiApplication, so they are created by _initialize_path().
+    _HELP_FONT = None
+    _INFO_FONT = None
 
     @staticmethod
     def _initialize_path():
@@ -17,33 +52,145 @@ class IconManager:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.dirname(current_dir)
             IconManager._icon_path = os.path.join(project_root, "resources", "icons")
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+            IconManager._HELP_FONT = QFont("Roboto", 14, QFont.Bold)
+            IconManager._INFO_FONT = QFont("Roboto", 12, QFont.Bold)
+            IconManager._cache_path = ICON_CACHE_DIR
+            # One directory listing each instead of an os.path.exists() per uncached icon.
+            IconManager._svg_set = {f[:-4] for f in IconManager._list_dir(IconManager._icon_path) if f.endswith(".svg")}
+            IconManager._cached_set = {f for f in IconManager._list_dir(IconManager._cache_path) if f.endswith(".png")}
+
+    @staticmethod
+    def _list_dir(path: str) -> list:
+        try:
+            return os.listdir(path)
+        except OSError:
+            return []
 
     @staticmethod
     def get_icon(name: str, color: QColor = None) -> QIcon:
-        cache_key = f"{name}_{color.name()}" if color else name
-        if cache_key in IconManager._icons:
-            return IconManager._icons[cache_key]
+        """
+        Loads or draws an icon once per (name, color); later calls are a dict lookup.
+        Drawn icons are also saved as PNGs, so later launches load them instead of painting.
+        """
+        # Hits are a single lru_cache lookup; the uncolored case skips the QColor call entirely.
+        if color is None:
+            return _load_icon(name)
+        return _load_icon(name, color.name())
+
+    @staticmethod
+    def clear_cache():
+        """Drops every cached icon and pixmap, e.g. after the theme colors change."""
+        _load_icon.cache_clear()
+        IconManager.get_pixmap.cache_clear()
+        QPixmapCache.clear()
+
+    @staticmethod
+    def prewarm(names: Iterable[str]):
+        """
+        Starts decoding the cached PNGs of the given icons on the global thread pool, so
+        their first get_icon() only converts an image. QPixmap and QPainter may only be
+        used on the GUI thread, so icons not in the PNG cache yet are drawn on first use.
+        """
         IconManager._initialize_path()
-        icon_path = os.path.join(IconManager._icon_path, f"{name}.svg")
-        if os.path.exists(icon_path) and not color:
-            icon = QIcon(icon_path)
-            IconManager._icons[name] = icon
-            return icon
-        pixmap = QPixmap(32, 32)
+        pixels = round(ICON_SIZE * IconManager._device_pixel_ratio())
+        files = [f for f in (IconManager._cache_name(name, IconManager._color, pixels) for name in names)
+                 if f in IconManager._cached_set]
+        if files:
+            QThreadPool.globalInstance().start(lambda: IconManager._decode_cached(files))
+
+    @staticmethod
+    def _decode_cached(files: list):
+        for cache_name in files:
+            image = QImage(os.path.join(IconManager._cache_path, cache_name))
+            if not image.isNull():
+                IconManager._prewarmed[cache_name] = image
+
+    @staticmethod
+    def _cache_name(name: str, color: QColor, pixels: int) -> str:
+        return f"{name}_{color.name().lstrip('#')}_{pixels}_v{ICON_CACHE_VERSION}.png"
+
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen else 1.0
+
+    @staticmethod
+    def _render(name: str, color: QColor, size: int = ICON_SIZE) -> QPixmap:
+        """
+        Returns the drawn pixmap from QPixmapCache, the PNG cache or, failing both, QPainter.
+        It is rasterized at `size` logical pixels times the screen's pixel ratio, not a fixed 32x32.
+        """
+        dpr = IconManager._device_pixel_ratio()
+        pixels = round(size * dpr)
+        cache_name = IconManager._cache_name(name, color, pixels)
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_name, pixmap):
+            return pixmap
+        cache_file = os.path.join(IconManager._cache_path, cache_name)
+        image = IconManager._prewarmed.pop(cache_name, None) if IconManager._prewarmed else None
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+        elif cache_name not in IconManager._cached_set or not pixmap.load(cache_file, "PNG"):
+            pixmap = QPixmap(pixels, pixels)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.scale(pixels / DRAW_SIZE, pixels / DRAW_SIZE)
+            painter.setPen(IconManager._DEFAULT_PEN if color == IconManager._color else _make_pen(color))
+            draw_func = getattr(IconManager, f"_draw_{name}_icon", IconManager._draw_default_icon)
+            draw_func(painter)
+            painter.end()
+            try:
+                os.makedirs(IconManager._cache_path, exist_ok=True)
+                if pixmap.save(cache_file, "PNG"):
+                    IconManager._cached_set.add(cache_name)
+            except OSError:
+                pass  # Unwritable cache directory: the icon is simply drawn again next launch
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_name, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _svg_source(name: str) -> bytes:
+        data = IconManager._svg_source_cache.get(name)
+        if data is None:
+            with open(os.path.join(IconManager._icon_path, f"{name}.svg"), "rb") as f:
+                data = IconManager._svg_source_cache[name] = f.read()
+        return data
+
+    @staticmethod
+    def _render_svg(name: str, color: QColor, size: int = ICON_SIZE) -> QPixmap:
+        """
+        Renders an on-disk SVG in `color` by substituting it for `currentColor` in the source.
+        The file is read once; each colored variant is rasterized once into QPixmapCache.
+        """
+        dpr = IconManager._device_pixel_ratio()
+        pixels = round(size * dpr)
+        cache_name = f"svg_{IconManager._cache_name(name, color, pixels)}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_name, pixmap):
+            return pixmap
+        source = IconManager._svg_source(name).replace(b"currentColor", color.name().encode())
+        renderer = QSvgRenderer(QByteArray(source))
+        pixmap = QPixmap(pixels, pixels)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        pen = QPen(color if color else IconManager._color)
-        pen.setWidth(2)
-        pen.setCapStyle(Qt.RoundCap)
-        pen.setJoinStyle(Qt.RoundJoin)
-        painter.setPen(pen)
-        draw_func = getattr(IconManager, f"_draw_{name}_icon", IconManager._draw_default_icon)
-        draw_func(painter)
+        renderer.render(painter)
         painter.end()
-        placeholder_icon = QIcon(pixmap)
-        IconManager._icons[cache_key] = placeholder_icon
-        return placeholder_icon
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_name, pixmap)
+        return pixmap
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_pixmap(name: str, width: int, height: int) -> QPixmap:
+        """Rasterizes the named icon once per size; later calls return the same pixmap."""
+        IconManager._initialize_path()
+        if name in IconManager._svg_set:
+            return IconManager.get_icon(name).pixmap(width, height)
+        # Drawn icons are rendered at the requested size rather than scaled from the ICON_SIZE one
+        return IconManager._render(name, IconManager._color, max(width, height))
 
     # --- Icon Drawing Methods ---
     @staticmethod
@@ -53,27 +200,27 @@ class IconManager:
     @staticmethod
     def _draw_switches_icon(p: QPainter): p.drawLine(6, 16, 26, 16); p.drawLine(10, 12, 10, 20); p.drawLine(16, 12, 16, 20); p.drawLine(22, 12, 22, 20)
     @staticmethod
-    def _draw_settings_icon(p: QPainter): p.drawEllipse(QRectF(8, 8, 16, 16)); p.drawLine(16, 6, 16, 10); p.drawLine(16, 22, 16, 26); p.drawLine(6, 16, 10, 16); p.drawLine(22, 16, 26, 16)
+    def _draw_settings_icon(p: QPainter): p.drawEllipse(_GEAR_RECT); p.drawLine(16, 6, 16, 10); p.drawLine(16, 22, 16, 26); p.drawLine(6, 16, 10, 16); p.drawLine(22, 16, 26, 16)
     @staticmethod
     def _draw_logs_icon(p: QPainter): p.drawRect(8, 6, 16, 20); p.drawLine(12, 12, 20, 12); p.drawLine(12, 18, 20, 18); p.drawLine(12, 24, 16, 24)
     @staticmethod
-    def _draw_help_icon(p: QPainter): p.drawEllipse(QRectF(6, 6, 20, 20)); p.setFont(QFont("Roboto", 14, QFont.Bold)); p.drawText(QRectF(6, 6, 20, 20), Qt.AlignCenter, "?")
+    def _draw_help_icon(p: QPainter): p.drawEllipse(_HELP_RECT); p.setFont(IconManager._HELP_FONT); p.drawText(_HELP_RECT, Qt.AlignCenter, "?")
     @staticmethod
-    def _draw_refresh_icon(p: QPainter): path = QPainterPath(); path.arcTo(QRectF(7, 7, 18, 18), 90, -270); p.drawPath(path); p.drawLine(7, 16, 11, 20); p.drawLine(7, 16, 3, 12)
+    def _draw_refresh_icon(p: QPainter): path = QPainterPath(); path.arcTo(_CIRCLE_RECT, 90, -270); p.drawPath(path); p.drawLine(7, 16, 11, 20); p.drawLine(7, 16, 3, 12)
     @staticmethod
     def _draw_total_devices_icon(p: QPainter): p.drawRect(7, 13, 18, 10); p.drawRect(10, 9, 12, 4)
     @staticmethod
-    def _draw_online_icon(p: QPainter): pen = p.pen(); pen.setColor(QColor(Style.STATUS_GREEN)); p.setPen(pen); p.drawPolyline([QPointF(9, 16), QPointF(14, 21), QPointF(23, 12)])
+    def _draw_online_icon(p: QPainter): pen = p.pen(); pen.setColor(_GREEN); p.setPen(pen); p.drawPolyline([QPointF(9, 16), QPointF(14, 21), QPointF(23, 12)])
     @staticmethod
-    def _draw_alert_icon(p: QPainter): pen = p.pen(); pen.setColor(QColor(Style.STATUS_RED)); p.setPen(pen); p.drawLine(16, 8, 16, 18); p.drawPoint(16, 22)
+    def _draw_alert_icon(p: QPainter): pen = p.pen(); pen.setColor(_RED); p.setPen(pen); p.drawLine(16, 8, 16, 18); p.drawPoint(16, 22)
     @staticmethod
     def _draw_backup_ok_icon(p: QPainter): IconManager._draw_online_icon(p)
     @staticmethod
     def _draw_config_icon(p: QPainter): IconManager._draw_settings_icon(p)
     @staticmethod
-    def _draw_warning_icon(p: QPainter): pen = p.pen(); pen.setColor(QColor(Style.STATUS_YELLOW)); p.setPen(pen); p.drawLine(8, 24, 16, 8); p.drawLine(16, 8, 24, 24); p.drawLine(8, 24, 24, 24); p.drawPoint(16, 20)
+    def _draw_warning_icon(p: QPainter): pen = p.pen(); pen.setColor(_YELLOW); p.setPen(pen); p.drawLine(8, 24, 16, 8); p.drawLine(16, 8, 24, 24); p.drawLine(8, 24, 24, 24); p.drawPoint(16, 20)
     @staticmethod
-    def _draw_offline_icon(p: QPainter): pen = p.pen(); pen.setColor(QColor(Style.STATUS_RED)); p.setPen(pen); p.drawLine(10, 10, 22, 22); p.drawLine(10, 22, 22, 10)
+    def _draw_offline_icon(p: QPainter): pen = p.pen(); pen.setColor(_RED); p.setPen(pen); p.drawLine(10, 10, 22, 22); p.drawLine(10, 22, 22, 10)
     @staticmethod
     def _draw_add_icon(p: QPainter): p.drawLine(16, 9, 16, 23); p.drawLine(9, 16, 23, 16)
     @staticmethod
@@ -87,7 +234,7 @@ class IconManager:
     @staticmethod
     def _draw_back_arrow_icon(p: QPainter): p.drawLine(20, 16, 8, 16); p.drawLine(13, 11, 8, 16); p.drawLine(13, 21, 8, 16)
     @staticmethod
-    def _draw_delete_icon(p: QPainter): pen = p.pen(); pen.setColor(QColor(Style.STATUS_RED)); p.setPen(pen); p.drawLine(10, 10, 22, 22); p.drawLine(10, 22, 22, 10)
+    def _draw_delete_icon(p: QPainter): pen = p.pen(); pen.setColor(_RED); p.setPen(pen); p.drawLine(10, 10, 22, 22); p.drawLine(10, 22, 22, 10)
     # --- NEW: Edit Icon ---
     @staticmethod
     def _draw_edit_icon(p: QPainter):
@@ -102,13 +249,13 @@ class IconManager:
 
     @staticmethod
     def _draw_info_icon(p: QPainter):
-        p.drawEllipse(QRectF(7, 7, 18, 18))
-        p.setFont(QFont("Roboto", 12, QFont.Bold))
-        p.drawText(QRectF(7, 7, 18, 18), Qt.AlignCenter, "i")
+        p.drawEllipse(_CIRCLE_RECT)
+        p.setFont(IconManager._INFO_FONT)
+        p.drawText(_CIRCLE_RECT, Qt.AlignCenter, "i")
 
     @staticmethod
     def _draw_scheduler_icon(p: QPainter):
-        p.drawEllipse(QRectF(7, 7, 18, 18))
+        p.drawEllipse(_CIRCLE_RECT)
         p.drawLine(16, 16, 16, 8)
         p.drawLine(16, 16, 20, 20)
     
@@ -132,7 +279,7 @@ class IconManager:
     @staticmethod
     def _draw_reboot_icon(p: QPainter):
         path = QPainterPath()
-        path.arcTo(QRectF(7, 7, 18, 18), 45, 270)
+        path.arcTo(_CIRCLE_RECT, 45, 270)
         p.drawPath(path)
         p.drawLine(21, 10, 25, 6)
         p.drawLine(21, 10, 17, 6)
@@ -155,3 +302,13 @@ class IconManager:
         p.drawLine(16, 14, 16, 10) # Port 2
         p.drawLine(22, 14, 22, 10) # Port 3
 
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _load_icon(name: str, color_hex: str = None) -> QIcon:
+    """Builds the QIcon behind IconManager.get_icon; keyed on plain strings so it can be LRU-cached."""
+    IconManager._initialize_path()
+    if name in IconManager._svg_set:
+        if color_hex is None:
+            return QIcon(os.path.join(IconManager._icon_path, f"{name}.svg"))
+        return QIcon(IconManager._render_svg(name, QColor(color_hex)))
+    return QIcon(IconManager._render(name, QColor(color_hex) if color_hex else IconManager._color))
@@ -8,18 +8,164 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QLineEdit,
-    QPushButton, QTableWidget, QHeaderView, QAbstractItemView,
-    QTableWidgetItem, QButtonGroup, QGraphicsDropShadowEffect, QMessageBox # Added QMessageBox for confirmation
+    QPushButton, QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate,
+    QButtonGroup, QGraphicsDropShadowEffect, QMessageBox # Added QMessageBox for confirmation
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-from datetime import datetime # Import datetime for the clear logs message
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF, QSize, QSortFilterProxyModel, QTimer
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter
+from utils.clock import now_str # Timestamp for the clear logs message
 
 from ui.icon_manager import IconManager
 from ui.styles import Style
 from utils.database import db_manager
 from utils.logger import app_logger # Keep this import
 
+# Level badge brushes (background, text), matching the #logINFO/#logWARNING/#logERROR styles.
+_INFO_BADGE = (QBrush(QColor("#2E7D32")), QColor("#FFFFFF"))
+_WARNING_BADGE = (QBrush(QColor("#FF8F00")), QColor("#000000"))
+_ERROR_BADGE = (QBrush(QColor("#D32F2F")), QColor("#FFFFFF"))
+_LEVEL_BRUSH = {
+    "INFO": _INFO_BADGE,
+    "DEBUG": _INFO_BADGE,
+    "WARNING": _WARNING_BADGE,
+    "ERROR": _ERROR_BADGE,
+    "CRITICAL": _ERROR_BADGE,
+}
+
+LOG_PAGE_SIZE = 500 # Log entries read from the database per fetch
+
+class LogTableModel(QAbstractTableModel):
+    """
+    Backs the logs table with a plain list of (level, timestamp, message) tuples,
+    newest first. The view only asks for the rows it paints. History is read from the
+    database a page at a time: the view calls fetchMore() as it scrolls to the bottom.
+    """
+    HEADERS = ["LEVEL", "TIMESTAMP", "MESSAGE"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._oldest_id = None # id of the last database row loaded
+        self._has_more = False
+
+    @property
+    def rows(self) -> list:
+        return self._rows
+
+    def load_latest(self):
+        """Replaces the rows with the newest page of logs from the database."""
+        self.beginResetModel()
+        self._rows = []
+        self._oldest_id = None
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._oldest_id = None
+        self._has_more = False
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        logs = db_manager.get_log_entries(LOG_PAGE_SIZE, before_id=self._oldest_id)
+        self._has_more = len(logs) == LOG_PAGE_SIZE
+        if not logs:
+            return
+        self._oldest_id = logs[-1]['id']
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(logs) - 1)
+        self._rows.extend((log['level'], log['timestamp'], log['message']) for log in logs)
+        self.endInsertRows()
+
+    def prepend(self, records: list):
+        """Inserts (level, timestamp, message) records, given oldest first, above the current rows."""
+        self.beginInsertRows(QModelIndex(), 0, len(records) - 1)
+        self._rows[:0] = reversed(records)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+class LogFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters logs by level and message text. The message match is Qt's own fixed-string
+    filter on the MESSAGE column; the level is a comparison against the selected button.
+    """
+    MESSAGE_COLUMN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._level = None # None shows every level
+        self.setFilterKeyColumn(self.MESSAGE_COLUMN)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def set_level_filter(self, level: str = None):
+        # Stored in the logger's upper case so each row is a plain comparison
+        self._level = level.upper() if level else None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Runs once per inserted row as records arrive; the whole model only when a filter changes."""
+        if self._level is not None and self.sourceModel().rows[source_row][0] != self._level:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+class LevelDelegate(QStyledItemDelegate):
+    """Paints the level column as a colored badge directly, with no per-row child widgets."""
+    BADGE_MIN_WIDTH = 80
+    BADGE_HEIGHT = 26
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont(parent.font()) if parent else QFont()
+        self._font.setBold(True)
+        self._widths = {} # level -> badge width; there are only a handful of levels
+
+    def _badge_width(self, level: str, option) -> int:
+        width = self._widths.get(level)
+        if width is None:
+            width = self._widths[level] = max(self.BADGE_MIN_WIDTH, option.fontMetrics.horizontalAdvance(level) + 20)
+        return width
+
+    def paint(self, painter, option, index):
+        level = index.data()
+        background, foreground = _LEVEL_BRUSH.get(level, _INFO_BADGE)
+        width = self._badge_width(level, option)
+        rect = QRectF(option.rect.center().x() - width / 2, option.rect.center().y() - self.BADGE_HEIGHT / 2,
+                      width, self.BADGE_HEIGHT)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setFont(self._font)
+        painter.setPen(foreground)
+        painter.drawText(rect, Qt.AlignCenter, level)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(self._badge_width(index.data(), option) + 20, 50)
+
 class LogsPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -41,6 +187,13 @@ class LogsPage(QWidget):
         main_layout.addLayout(header_layout)
         main_layout.addWidget(table_panel)
 
+        # Live records arrive one signal each; they are added to the table in batches
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         # NEW: Load historical logs on startup
         self._load_historical_logs()
 
@@ -54,7 +207,12 @@ class LogsPage(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search logs...")
         self.search_input.setObjectName("searchInput")
-        self.search_input.textChanged.connect(self._filter_table)
+        # Coalesce keystrokes so the filter runs once typing pauses.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         # Filter buttons
         self.filter_button_group = QButtonGroup(self)
@@ -69,7 +227,7 @@ class LogsPage(QWidget):
         self.filter_button_group.addButton(btn_info, 1)
         self.filter_button_group.addButton(btn_warning, 2)
         self.filter_button_group.addButton(btn_error, 3)
-        self.filter_button_group.buttonClicked.connect(self._filter_table)
+        self.filter_button_group.buttonClicked.connect(self._apply_level_filter)
 
         clear_button = QPushButton("Clear Logs")
         clear_button.setIcon(IconManager.get_icon("delete")) # Changed icon to delete for clarity
@@ -91,10 +249,14 @@ class LogsPage(QWidget):
         panel_layout = QVBoxLayout(panel)
         panel_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.table = QTableWidget()
+        self.log_model = LogTableModel(self)
+        self.log_proxy = LogFilterProxyModel(self)
+        self.log_proxy.setSourceModel(self.log_model)
+        self.table = QTableView()
         self.table.setObjectName("logsTable")
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["LEVEL", "TIMESTAMP", "MESSAGE"])
+        self.table.setModel(self.log_proxy)
+        self.table.setItemDelegateForColumn(0, LevelDelegate(self.table))
+        self.table.verticalHeader().setDefaultSectionSize(50)
         
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -116,66 +278,31 @@ class LogsPage(QWidget):
         return panel
 
     def add_log_record(self, level, timestamp, message):
-        """Inserts a new row at the top of the table with the log data."""
-        row_position = 0
-        self.table.insertRow(row_position)
-        
-        self.table.setCellWidget(row_position, 0, self._create_level_widget(level))
-        self.table.setItem(row_position, 1, QTableWidgetItem(timestamp))
-        self.table.setItem(row_position, 2, QTableWidgetItem(message))
-        
-        self.table.setRowHeight(row_position, 50)
-        # Re-apply filter to the new row
-        self._filter_table()
-
-    def _create_level_widget(self, level):
-        """Creates a styled QLabel for the log level."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(10, 5, 10, 5)
-        layout.setAlignment(Qt.AlignCenter)
-        
-        level_label = QLabel(level)
-        level_label.setObjectName(f"log{level}")
-        
-        layout.addWidget(level_label)
-        return widget
+        """Queues a new row for the top of the table; queued rows are inserted together."""
+        self._pending.append((level, timestamp, message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-    def _filter_table(self):
-        """Filters the table based on the selected level and search text."""
-        search_text = self.search_input.text().lower()
-        checked_button = self.filter_button_group.checkedButton()
-        level_filter = checked_button.text().lower() if checked_button else "all"
-
-        for row in range(self.table.rowCount()):
-            level_widget = self.table.cellWidget(row, 0)
-            # Ensure level_widget and its child QLabel exist before accessing
-            if level_widget and level_widget.findChild(QLabel):
-                level_text = level_widget.findChild(QLabel).text().lower()
-                message_item = self.table.item(row, 2)
-                message_text = message_item.text().lower() if message_item else ""
+    def _flush_pending(self):
+        """Inserts every queued record in one model insert; the proxy filters them on its own."""
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.log_model.prepend(batch)
 
-                level_match = (level_filter == "all" or level_filter == level_text)
-                text_match = (search_text == "" or search_text in message_text)
+    def _apply_search_filter(self):
+        """Filters the table by the search text (case-insensitive substring of the message)."""
+        self.log_proxy.setFilterFixedString(self.search_input.text())
 
-                self.table.setRowHidden(row, not (level_match and text_match))
-            else:
-                self.table.setRowHidden(row, True) # Hide rows with incomplete data
+    def _apply_level_filter(self):
+        """Filters the table by the checked level button."""
+        checked_button = self.filter_button_group.checkedButton()
+        level_filter = checked_button.text().lower() if checked_button else "all"
+        self.log_proxy.set_level_filter(None if level_filter == "all" else level_filter)
 
     # NEW: Method to load historical logs from DB
     def _load_historical_logs(self):
-        """Loads all log entries from the database and populates the table."""
-        logs = db_manager.get_all_log_entries()
-        self.table.setRowCount(0) # Clear existing rows
-        for log in logs:
-            # Insert at row 0 to keep newest logs at the top
-            row_position = 0
-            self.table.insertRow(row_position)
-            self.table.setCellWidget(row_position, 0, self._create_level_widget(log['level']))
-            self.table.setItem(row_position, 1, QTableWidgetItem(log['timestamp']))
-            self.table.setItem(row_position, 2, QTableWidgetItem(log['message']))
-            self.table.setRowHeight(row_position, 50)
-        self._filter_table() # Apply any initial filter
+        """Loads the newest page of log entries; older ones load as the table is scrolled."""
+        self.log_model.load_latest()
 
     # NEW: Method to clear logs from DB and UI
     def _clear_all_logs(self):
@@ -185,9 +312,11 @@ class LogsPage(QWidget):
                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             db_manager.clear_all_log_entries()
-            self.table.setRowCount(0) # Clear UI table
+            self._pending.clear()
+            self.log_model.clear() # Clear UI table
             self.logger.info("All application logs cleared.") # FIX: Use self.logger
+            self._flush_pending() # The record above is only queued; count it before checking
             # Re-add a message if no logs are present after clearing
-            if self.table.rowCount() == 0:
-                self.add_log_record("INFO", datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "Logs have been cleared.")
+            if self.log_model.rowCount() == 0:
+                self.add_log_record("INFO", now_str(), "Logs have been cleared.")
 
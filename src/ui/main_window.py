@@ -15,6 +15,10 @@ from PySide6.QtGui import QIcon
 
 from utils.logger import app_logger
 from utils.scheduler import scheduler_manager
+from network.ping_service import PingService
+from network.snmp_worker import snmp_poller
+from network.ssh_worker import ssh_pool
+from utils.database import backup_writer
 # --- FIX: Corrected import path after moving toast.py ---
 from ui.toast import Toast
 from ui.logs_page import LogsPage
@@ -33,12 +37,14 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1600, 960)
         self.setStyleSheet(Style.get_stylesheet("dark"))
         self.active_toasts = []
+        self.ping_service = PingService()
         self._create_widgets()
         self._create_layouts()
         self._connect_signals()
         self._set_initial_page()
         
         scheduler_manager.start()
+        self.ping_service.start()
         
         self.logger.info("Application successfully started.")
         self.show_toast("Welcome to NMSimple Suite!", "info")
@@ -60,7 +66,7 @@ class MainWindow(QMainWindow):
         self.nav_list.addItem(QListWidgetItem(IconManager.get_icon("logs"), "Logs"))
         
         self.content_area = QStackedWidget(self.central_widget); self.content_area.setObjectName("contentArea")
-        self.dashboard_page = DashboardPage(); self.switch_page = DevicesPage();  self.logs_page = LogsPage()
+        self.dashboard_page = DashboardPage(); self.switch_page = DevicesPage(self.ping_service);  self.logs_page = LogsPage()
         self.device_detail_page = DeviceDetailPage(); self.scheduler_page = SchedulerPage()
         
         
@@ -87,6 +93,10 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         scheduler_manager.stop()
+        self.ping_service.stop()
+        snmp_poller.stop()
+        ssh_pool.close_all()
+        backup_writer.stop()
         event.accept()
 
     def _create_layouts(self):
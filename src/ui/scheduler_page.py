@@ -126,7 +126,7 @@ class SchedulerPage(QWidget):
         
         main_layout = QHBoxLayout(card); main_layout.setSpacing(20)
 
-        icon = QLabel(); icon.setPixmap(IconManager.get_icon("scheduler").pixmap(32,32))
+        icon = QLabel(); icon.setPixmap(IconManager.get_pixmap("scheduler", 32, 32))
         
         text_layout = QVBoxLayout(); text_layout.setSpacing(5)
         job_name = QLabel(job.name); job_name.setObjectName("jobName")
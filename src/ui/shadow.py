@@ -0,0 +1,58 @@
+# ui/shadow.py
+# Description: Soft drop shadows painted from one pre-rendered 9-slice tile. A cheap stand-in
+# for QGraphicsDropShadowEffect, which renders its widget off-screen and blurs it on every repaint.
+
+import math
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+SHADOW_BLUR = 15     # px the shadow fades over beyond the widget's edge
+SHADOW_RADIUS = 12   # matches the border-radius of #CardWidget / #PanelWidget
+SHADOW_OFFSET = 4    # px the shadow is shifted down
+SHADOW_COLOR = QColor(0, 0, 0, 80)
+
+_tile = None
+
+
+def _shadow_tile() -> QPixmap:
+    """
+    Renders the tile once: the four corner shadows around a 1 px centre row and column,
+    which are stretched along the edges when the shadow is drawn.
+    """
+    global _tile
+    if _tile is None:
+        corner = SHADOW_BLUR + SHADOW_RADIUS
+        side = 2 * corner + 1
+        image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        image.fill(0)
+        color = QColor(SHADOW_COLOR)
+        for y in range(side):
+            for x in range(side):
+                # Distance outside the rounded rectangle, whose corner arcs all meet at the centre
+                distance = max(0.0, math.hypot(x - corner, y - corner) - SHADOW_RADIUS)
+                if distance < SHADOW_BLUR:
+                    fade = 1 - distance / SHADOW_BLUR
+                    color.setAlpha(int(SHADOW_COLOR.alpha() * fade * fade))
+                    image.setPixelColor(x, y, color)
+        _tile = QPixmap.fromImage(image)
+    return _tile
+
+
+def draw_shadow(painter: QPainter, rect: QRect):
+    """Paints a drop shadow for a widget occupying `rect`, in the painter's coordinates."""
+    tile = _shadow_tile()
+    corner = SHADOW_BLUR + SHADOW_RADIUS
+    outer = rect.translated(0, SHADOW_OFFSET).adjusted(-SHADOW_BLUR, -SHADOW_BLUR, SHADOW_BLUR, SHADOW_BLUR)
+    # Column and row boundaries of the nine slices, in the target and in the tile
+    xs = (outer.left(), outer.left() + corner, outer.right() + 1 - corner, outer.right() + 1)
+    ys = (outer.top(), outer.top() + corner, outer.bottom() + 1 - corner, outer.bottom() + 1)
+    src = (0, corner, corner + 1, 2 * corner + 1)
+    for row in range(3):
+        for col in range(3):
+            if row == col == 1:
+                continue  # the centre is hidden behind the widget itself
+            target = QRect(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row])
+            if target.width() > 0 and target.height() > 0:
+                source = QRect(src[col], src[row], src[col + 1] - src[col], src[row + 1] - src[row])
+                painter.drawPixmap(target, tile, source)
@@ -10,14 +10,15 @@ from PySide6.QtWidgets import (
     QPushButton, QTableWidget, QHeaderView, QAbstractItemView,
     QTableWidgetItem, QGraphicsDropShadowEffect, QMessageBox, QAbstractScrollArea
 )
-from PySide6.QtCore import Qt, QSize, Signal, QThread
-from datetime import datetime
+from PySide6.QtCore import Qt, QSize, Signal, QThread, QTimer
 from PySide6.QtGui import QColor
 
+from utils.clock import now_str
 from utils.database import db_manager
 from utils.logger import app_logger
-from network.ssh_worker import SSHWorker
-from network.ping_worker import PingWorker
+from network.ssh_worker import SSHBackupTask, SSHWorker, ssh_thread_pool
+from network.ping_pool import PingBatcher, PingPoolWorker
+from network.ping_worker import PING_TIMEOUT, ping_thread_pool
 from ui.add_device_dialog import AddDeviceDialog
 from ui.icon_manager import IconManager
 from ui.styles import Style
@@ -25,10 +26,19 @@ from ui.styles import Style
 class DevicesPage(QWidget):
     device_selected = Signal(dict)
 
-    def __init__(self, parent=None):
+    def __init__(self, ping_service, parent=None):
         super().__init__(parent)
         self.setObjectName("devicesPage")
-        self.threads = {}; self.ping_threads = {}
+        self.ping_service = ping_service
+        self.threads = {}; self.ping_thread = None; self._ping_stop_requested = False; self._silent_pings_remaining = 0
+        self.ping_batcher = PingBatcher(parent=self); self.ping_batcher.batch_ready.connect(self._on_ping_batch)
+        self.ping_service.result_ready.connect(self._on_silent_ping_result)
+        # Clears a silent status check whose results never all arrived, so the scheduler is not locked out.
+        self._silent_watchdog = QTimer(self); self._silent_watchdog.setSingleShot(True)
+        self._silent_watchdog.timeout.connect(self._on_silent_check_expired)
+        # Backup completions arrive in bursts; rebuild the table at most once per interval.
+        self._refresh_timer = QTimer(self); self._refresh_timer.setSingleShot(True); self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self.refresh_table)
         main_layout = QVBoxLayout(self); main_layout.setContentsMargins(30, 30, 30, 30); main_layout.setSpacing(25)
         header_layout = self._create_header(); main_layout.addLayout(header_layout)
         table_panel = self._create_table_panel(); main_layout.addWidget(table_panel)
@@ -37,19 +47,39 @@ class DevicesPage(QWidget):
     # --- NEW: Silent methods for the scheduler ---
     def run_status_check_silent(self):
         """Initiates a ping check for all devices without user feedback."""
+        if self._silent_pings_remaining > 0:
+            app_logger.get_logger().debug("[Scheduler] Status check already running (silent).")
+            return
         # FIX: Change this log to debug level
         app_logger.get_logger().debug("[Scheduler] Starting network-wide status check (silent)...")
         devices = db_manager.get_all_devices()
         if not devices:
             app_logger.get_logger().debug("[Scheduler] No devices to ping.") # FIX: Change to debug
             return
-            
+
+        # Pings are handed to the persistent ping service so the GUI thread never blocks on them.
+        self._silent_pings_remaining = len(devices)
+        # Worst case: pings wait in the bounded pool in waves, each up to the command ping's timeout.
+        waves = -(-len(devices) // max(1, ping_thread_pool().maxThreadCount()))
+        self._silent_watchdog.start((waves + 1) * (PING_TIMEOUT + 1) * 1000)
         for device_data in devices:
-            # Note: This runs pings sequentially from the scheduler's signal.
-            # For large networks, this should also be threaded, but is fine for now.
-            db_manager.update_device_status(device_data['id'], self._ping_device_sync(device_data['ip']))
-        app_logger.get_logger().debug("[Scheduler] Status check finished (silent).") # FIX: Change to debug
-        self.refresh_table()
+            self.ping_service.submit(device_data.get('id', -1), device_data.get('ip'), device_data.get('probe_port'))
+
+    def _on_silent_ping_result(self, device_id, status):
+        db_manager.update_device_status(device_id, status)
+        if self._silent_pings_remaining <= 0:
+            return  # a late result from a check the watchdog already cleared
+        self._silent_pings_remaining -= 1
+        if self._silent_pings_remaining <= 0:
+            self._silent_watchdog.stop()
+            app_logger.get_logger().debug("[Scheduler] Status check finished (silent).") # FIX: Change to debug
+            self.refresh_table()
+
+    def _on_silent_check_expired(self):
+        if self._silent_pings_remaining > 0:
+            app_logger.get_logger().warning(f"[Scheduler] Status check gave up on {self._silent_pings_remaining} unanswered ping(s).")
+            self._silent_pings_remaining = 0
+            self.refresh_table()
 
     def run_backup_all_silent(self):
         """Initiates a backup for all devices without user feedback."""
@@ -58,22 +88,15 @@ class DevicesPage(QWidget):
         for device_data in devices:
             self._run_backup(device_data, silent=True)
 
-    def _ping_device_sync(self, ip):
-        """A synchronous ping for the silent checker."""
-        import subprocess, platform
-        param = '-n' if platform.system().lower() == 'windows' else '-c'
-        command = ['ping', param, '1', '-w', '2', ip]
-        return "Online" if subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0 else "Offline"
-
     # --- Modified methods to handle 'silent' mode ---
     def _run_backup(self, device_data: dict, silent=False):
         device_id = device_data['id']
-        if device_id in self.threads and self.threads[device_id].isRunning():
+        if device_id in self.threads:
             if not silent: self.window().show_toast(f"Backup for {device_data['name']} is already in progress.", "info")
             return
         if not silent: self.window().show_toast(f"Backup initiated for {device_data['name']}...", "info")
         
-        thread = QThread(); worker = SSHWorker(device_data); worker.moveToThread(thread)
+        worker = SSHWorker(device_data)
         # Use different slots for silent mode
         if silent:
             worker.success.connect(self._on_backup_success_silent)
@@ -82,12 +105,11 @@ class DevicesPage(QWidget):
             worker.success.connect(self._on_backup_success)
             worker.error.connect(self._on_backup_error)
 
-        worker.finished.connect(thread.quit); worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater); thread.finished.connect(lambda: self.threads.pop(device_id, None))
-        thread.started.connect(worker.run_backup); thread.start(); self.threads[device_id] = (thread, worker)
+        worker.finished.connect(lambda: self.threads.pop(device_id, None)); worker.finished.connect(worker.deleteLater)
+        self.threads[device_id] = worker; ssh_thread_pool().start(SSHBackupTask(worker))
 
     def _on_backup_success(self, device_id, config_output):
-        db_manager.update_last_backup(device_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S")); self.refresh_table()
+        db_manager.update_last_backup(device_id, now_str()); self._schedule_refresh()
         device = next((d for d in self.devices_data if d['id'] == device_id), None)
         self.window().show_toast(f"Backup successful for {device['name'] if device else 'device'}.", "success")
         app_logger.get_logger().info(f"Backup successful for device ID: {device_id}") # Keep as INFO
@@ -99,12 +121,16 @@ class DevicesPage(QWidget):
 
     def _on_backup_success_silent(self, device_id, config_output):
         app_logger.get_logger().info(f"[Scheduler] Backup successful for device ID: {device_id}") # Keep as INFO
-        db_manager.update_last_backup(device_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        self.refresh_table()
+        db_manager.update_last_backup(device_id, now_str())
+        self._schedule_refresh()
 
     def _on_backup_error_silent(self, device_id, error_message):
         app_logger.get_logger().error(f"[Scheduler] Backup failed for device ID {device_id}: {error_message}") # Keep as ERROR
 
+    def _schedule_refresh(self):
+        """Queues a table refresh; completions within the same 200 ms window share it."""
+        if not self._refresh_timer.isActive(): self._refresh_timer.start()
+
     # (The rest of the file remains the same...)
     def _create_header(self):
         header_layout = QHBoxLayout(); title_label = QLabel("Device Management"); title_label.setObjectName("pageTitle")
@@ -117,39 +143,46 @@ class DevicesPage(QWidget):
         header_layout.addWidget(title_label); header_layout.addStretch(); header_layout.addWidget(self.search_input); header_layout.addWidget(self.refresh_status_button); header_layout.addWidget(add_device_button)
         return header_layout
     def _run_status_check(self):
+        if self.ping_thread is not None:
+            # The button doubles as "Stop" while a sweep is running.
+            self._ping_stop_requested = True
+            self.refresh_status_button.setEnabled(False)
+            self.ping_thread[1].stop()
+            return
         if not self.devices_data:
             return
         self.window().show_toast(f"Pinging {len(self.devices_data)} devices...", "info")
-        self.refresh_status_button.setEnabled(False)
-        self.refresh_status_button.setText("Pinging...")
-        app_logger.get_logger().info("Starting ping in main thread.")
-        self.active_ping_threads = len(self.devices_data)
-        for device_data in self.devices_data:
-            thread = QThread()
-            worker = PingWorker(device_data)
-            worker.moveToThread(thread)
-            worker.result_ready.connect(self._on_ping_result)
-            worker.finished.connect(thread.quit)
-            worker.finished.connect(worker.deleteLater)
-            thread.finished.connect(thread.deleteLater)
-            thread.finished.connect(self._on_ping_thread_finished)
-            thread.started.connect(worker.run_ping)
-            # Strong reference to both
-            self.ping_threads[device_data['id']] = (thread, worker)
-            thread.start()
-
-    def _on_ping_result(self, device_id, status):
-        db_manager.update_device_status(device_id, status)
-        for row in range(self.table.rowCount()):
-            if self.devices_data[row]['id'] == device_id:
-                self.table.setCellWidget(row, 1, self._create_status_widget(status)); self.devices_data[row]['status'] = status; break
-        app_logger.get_logger().info(f"Device ID {device_id} status updated to: {status}") # Keep as INFO
+        self._ping_stop_requested = False
+        self.refresh_status_button.setText("Stop Pinging")
+        app_logger.get_logger().info("Starting ping sweep in background thread.")
+        thread = QThread()
+        worker = PingPoolWorker(list(self.devices_data), self.ping_batcher)
+        worker.moveToThread(thread)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_ping_thread_finished)
+        thread.started.connect(worker.run)
+        # Strong reference to both
+        self.ping_thread = (thread, worker)
+        self.ping_batcher.start()
+        thread.start()
+
+    def _on_ping_batch(self, results):
+        db_manager.update_device_statuses(results)
+        row_by_id = {device['id']: row for row, device in enumerate(self.devices_data)}
+        for device_id, status in results:
+            row = row_by_id.get(device_id)
+            if row is not None and row < self.table.rowCount():
+                self.table.setCellWidget(row, 1, self._create_status_widget(status)); self.devices_data[row]['status'] = status
+            app_logger.get_logger().info(f"Device ID {device_id} status updated to: {status}") # Keep as INFO
     def _on_ping_thread_finished(self):
-        self.active_ping_threads -= 1
-        if self.active_ping_threads <= 0:
-            app_logger.get_logger().info("Network-wide status check finished (manual).") # Keep as INFO
-            self.window().show_toast("Status check complete.", "success")
-            self.refresh_status_button.setEnabled(True); self.refresh_status_button.setText("Refresh Status")
+        self.ping_thread = None
+        self.ping_batcher.stop()
+        app_logger.get_logger().info("Network-wide status check finished (manual).") # Keep as INFO
+        if self._ping_stop_requested: self.window().show_toast("Status check stopped.", "info")
+        else: self.window().show_toast("Status check complete.", "success")
+        self.refresh_status_button.setEnabled(True); self.refresh_status_button.setText("Refresh Status")
     def _create_table_panel(self):
         panel = QFrame(); panel.setObjectName("PanelWidget"); panel_layout = QVBoxLayout(panel); panel_layout.setContentsMargins(0, 0, 0, 0)
         self.table = QTableWidget(); self.table.setObjectName("devicesTable"); self.table.setColumnCount(8); self.table.setHorizontalHeaderLabels(["DEVICE INFO", "STATUS", "MODEL", "LAST BACKUP", "USERNAME", "PASSWORD", "SNMP COMMUNITY", "ACTIONS"])
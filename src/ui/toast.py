@@ -32,7 +32,7 @@ class Toast(QFrame):
         }.get(toast_type, 'info')
         
         icon_label = QLabel()
-        icon_label.setPixmap(IconManager.get_icon(icon_name).pixmap(22, 22))
+        icon_label.setPixmap(IconManager.get_pixmap(icon_name, 22, 22))
         
         message_label = QLabel(message)
         message_label.setWordWrap(True)
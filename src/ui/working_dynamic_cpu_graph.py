@@ -8,8 +8,8 @@ from typing import Dict, Any
 from datetime import datetime, timedelta
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, QPointF
-from PySide6.QtGui import QColor, QFont, QPainter, QPen, QLinearGradient, QPainterPath
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QThread, QObject, QPointF, QCoreApplication
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QLinearGradient, QPainterPath, QPixmap
 
 from ui.styles import Style
 from utils.logger import app_logger
@@ -22,11 +22,20 @@ class CPUDataWorker(QObject):
     error_occurred = Signal(str)
     finished = Signal()  # Add finished signal
     
-    def __init__(self, device_info: Dict[str, Any]):
+    def __init__(self, device_info: Dict[str, Any] = None):
         super().__init__()
-        self.device_info = device_info
+        self.device_info = device_info or {}
         self.logger = app_logger.get_logger()
         
+    @Slot(dict)
+    def fetch(self, device_info: Dict[str, Any]):
+        """Queued entry point: one sample for `device_info`, on the worker's own thread."""
+        self.device_info = device_info
+        # Start every sample from a fresh base, as when a new worker was built per sample;
+        # carrying _last_cpu over drifts up to the 95% clamp and across device switches.
+        self.__dict__.pop('_last_cpu', None)
+        self.run()
+        
     def run(self):  # Changed from run_fetch to run
         """Generate simulated CPU data with realistic patterns."""
         try:
@@ -88,6 +97,8 @@ class CPUDataWorker(QObject):
 class WorkingDynamicCPUGraph(QWidget):
     """A working CPU graph widget with proper visualization."""
     
+    fetch_requested = Signal(dict)  # queued to the long-lived CPUDataWorker
+    
     def __init__(self, device_info: Dict[str, Any] = None, parent=None):
         super().__init__(parent)
         self.device_info = device_info or {}
@@ -107,11 +118,27 @@ class WorkingDynamicCPUGraph(QWidget):
         # Initialize with some data AFTER UI is setup
         self._initialize_data()
         
-        # Thread management
+        # Thread management: one worker thread, started on first fetch and reused for every sample
         self.worker_thread = None
+        self.worker = None
+        self._fetch_pending = False
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._fetch_new_data)
         
+        # Samples are stored as they arrive; repaints are capped at ~15 FPS however fast they come.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(66)
+        self._repaint_timer.timeout.connect(self.update)
+        
+        # Frame, grid and axis labels only change with the size: rendered once into a pixmap.
+        self._background = None
+        self._line_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY)); self._line_pen.setWidth(2)
+        self._point_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY)); self._point_pen.setWidth(3)
+        self._point_brush = QColor(Style.DARK_ACCENT_PRIMARY)
+        self._fill_colors = (QColor(Style.DARK_ACCENT_PRIMARY).lighter(150), QColor(Style.DARK_BG_SECONDARY))
+        self._time_label_color = QColor(Style.DARK_TEXT_SECONDARY)
+        
         self.logger = app_logger.get_logger()
         
         # Force initial paint
@@ -210,43 +237,53 @@ class WorkingDynamicCPUGraph(QWidget):
             if self.update_timer.isActive():
                 self.update_timer.stop()
             
-            if self.worker_thread and self.worker_thread.isRunning():
-                self.worker_thread.quit()
-                self.worker_thread.wait(1000)
-            
             self.status_label.setText("Monitoring stopped")
             self.status_label.setStyleSheet(f"color: {Style.DARK_TEXT_SECONDARY};")
             
         except Exception as e:
             self.logger.error(f"Error stopping CPU monitoring: {e}")
     
+    def _ensure_worker(self):
+        """Starts the worker thread the first time a sample is needed."""
+        if self.worker_thread is not None:
+            return
+        self.worker_thread = QThread()
+        self.worker = CPUDataWorker()
+        self.worker.moveToThread(self.worker_thread)
+        
+        # Connect signals
+        self.worker.data_received.connect(self._on_data_received)
+        self.worker.error_occurred.connect(self._on_error_occurred)
+        self.worker.finished.connect(self._on_fetch_finished)
+        self.fetch_requested.connect(self.worker.fetch)
+        
+        # Cleanup: the thread lives until the application quits
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        QCoreApplication.instance().aboutToQuit.connect(self._shutdown_worker)
+        self.worker_thread.start()
+    
+    def _shutdown_worker(self):
+        if self.worker_thread is not None:
+            self.worker_thread.quit()
+            self.worker_thread.wait(1000)
+    
     def _fetch_new_data(self):
         """Fetch new CPU data."""
         try:
-            if self.worker_thread and self.worker_thread.isRunning():
+            if self._fetch_pending:
                 return
             
-            self.worker_thread = QThread()
-            self.worker = CPUDataWorker(self.device_info)
-            self.worker.moveToThread(self.worker_thread)
-            
-            # Connect signals
-            self.worker.data_received.connect(self._on_data_received)
-            self.worker.error_occurred.connect(self._on_error_occurred)
-            self.worker.finished.connect(self.worker_thread.quit)
-            self.worker.finished.connect(self.worker.deleteLater)
-            
-            # Cleanup
-            self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-            self.worker_thread.finished.connect(lambda: setattr(self, 'worker_thread', None))
-            
-            # Start worker - FIXED: Connect to 'run' instead of 'run_fetch'
-            self.worker_thread.started.connect(self.worker.run)
-            self.worker_thread.start()
+            self._ensure_worker()
+            self._fetch_pending = True
+            self.fetch_requested.emit(dict(self.device_info))
             
         except Exception as e:
+            self._fetch_pending = False
             self.logger.error(f"Error starting CPU fetch: {e}")
     
+    def _on_fetch_finished(self):
+        self._fetch_pending = False
+    
     def _on_data_received(self, cpu_value: float):
         """Handle new CPU data with improved real-time updates."""
         try:
@@ -274,122 +311,132 @@ class WorkingDynamicCPUGraph(QWidget):
                 self.status_label.setText("✅ Normal CPU Usage")
                 self.status_label.setStyleSheet(f"color: {Style.STATUS_GREEN};")
             
-            # Force immediate repaint for smooth updates
-            self.repaint()  # Use repaint() instead of update() for immediate drawing
+            # Coalesce with any other samples arriving in the same frame window
+            self._schedule_repaint()
             
             self.logger.debug(f"CPU updated: {cpu_value:.1f}%")
             
         except Exception as e:
             self.logger.error(f"Error handling CPU data: {e}")
     
+    def _schedule_repaint(self):
+        """Queues one repaint for the next ~66 ms window; extra requests within it are dropped."""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
     def _on_error_occurred(self, error_message: str):
         """Handle errors."""
         self.status_label.setText("CPU data unavailable")
         self.status_label.setStyleSheet(f"color: {Style.STATUS_RED};")
         self.logger.warning(f"CPU graph error: {error_message}")
     
-    def paintEvent(self, event):
-        """Paint the CPU graph."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Get dimensions for graph area (leave space for header and status)
-        widget_width = self.width()
-        widget_height = self.height()
-        
-        # Define graph area (leave space for header/status)
+    def _graph_area(self):
+        """Returns (left, top, right, bottom) of the plot area, leaving room for header, status and labels."""
         margin = 20
         graph_top = 80  # Space for header
-        graph_bottom = widget_height - 40  # Space for status
+        graph_bottom = self.height() - 40  # Space for status
         graph_left = margin + 40  # Space for Y-axis labels
-        graph_right = widget_width - margin
-        
+        graph_right = self.width() - margin
+        return graph_left, graph_top, graph_right, graph_bottom
+    
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+    
+    def _render_background(self):
+        """Draws the static part of the graph (background, border, grid, Y-axis labels) into a pixmap."""
+        graph_left, graph_top, graph_right, graph_bottom = self._graph_area()
         graph_width = graph_right - graph_left
         graph_height = graph_bottom - graph_top
         
-        if graph_width <= 0 or graph_height <= 0:
-            return
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font())
         
         # Draw graph background
         painter.fillRect(graph_left, graph_top, graph_width, graph_height, 
                         QColor(Style.DARK_BG_SECONDARY))
         
-        # Draw border
-        border_pen = QPen(QColor(Style.DARK_BORDER))
-        border_pen.setWidth(1)
-        painter.setPen(border_pen)
-        painter.drawRect(graph_left, graph_top, graph_width, graph_height)
-        
-        # Draw horizontal grid lines and Y-axis labels
+        # Draw border, horizontal grid lines and Y-axis labels
         grid_pen = QPen(QColor(Style.DARK_BORDER))
         grid_pen.setWidth(1)
         painter.setPen(grid_pen)
+        painter.drawRect(graph_left, graph_top, graph_width, graph_height)
         
         # Draw horizontal lines for CPU percentages
         for i in range(6):  # 0%, 20%, 40%, 60%, 80%, 100%
             percentage = i * 20
             y = graph_bottom - (percentage / 100.0 * graph_height)
-            
-            # Draw grid line
-            painter.drawLine(graph_left, y, graph_right, y)
-            
-            # Draw percentage label
-            painter.drawText(graph_left - 35, y + 5, f"{percentage}%")
+            painter.drawLine(QPointF(graph_left, y), QPointF(graph_right, y))
+            painter.drawText(QPointF(graph_left - 35, y + 5), f"{percentage}%")
+        
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the CPU graph: the cached background, then the live data on top."""
+        graph_left, graph_top, graph_right, graph_bottom = self._graph_area()
+        graph_width = graph_right - graph_left
+        graph_height = graph_bottom - graph_top
+        
+        if graph_width <= 0 or graph_height <= 0:
+            return
+        
+        if self._background is None:
+            self._background = self._render_background()
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw the CPU data line
         if len(self.cpu_data) >= 2:
             # Create points for the line
-            points = []
-            for i, cpu_value in enumerate(self.cpu_data):
-                x = graph_left + (graph_width * i / (len(self.cpu_data) - 1))
-                y = graph_bottom - (cpu_value / 100.0 * graph_height)
-                points.append(QPointF(x, y))
+            last_index = len(self.cpu_data) - 1
+            points = [
+                QPointF(graph_left + (graph_width * i / last_index), graph_bottom - (cpu_value / 100.0 * graph_height))
+                for i, cpu_value in enumerate(self.cpu_data)
+            ]
             
             # Draw the main line
-            line_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY))
-            line_pen.setWidth(2)
-            painter.setPen(line_pen)
-            
-            for i in range(1, len(points)):
-                painter.drawLine(points[i-1], points[i])
+            painter.setPen(self._line_pen)
+            painter.drawPolyline(points)
             
             # Draw fill area under the line
-            if points:
-                gradient = QLinearGradient(0, graph_top, 0, graph_bottom)
-                gradient.setColorAt(0.0, QColor(Style.DARK_ACCENT_PRIMARY).lighter(150))
-                gradient.setColorAt(1.0, QColor(Style.DARK_BG_SECONDARY))
-                painter.setBrush(gradient)
-                painter.setPen(Qt.NoPen)
-                
-                # Create fill path
-                fill_path = QPainterPath()
-                fill_path.moveTo(points[0].x(), graph_bottom)
-                for point in points:
-                    fill_path.lineTo(point)
-                fill_path.lineTo(points[-1].x(), graph_bottom)
-                fill_path.closeSubpath()
-                
-                painter.drawPath(fill_path)
+            gradient = QLinearGradient(0, graph_top, 0, graph_bottom)
+            gradient.setColorAt(0.0, self._fill_colors[0])
+            gradient.setColorAt(1.0, self._fill_colors[1])
+            painter.setBrush(gradient)
+            painter.setPen(Qt.NoPen)
             
-            # Draw data points
-            point_pen = QPen(QColor(Style.DARK_ACCENT_PRIMARY))
-            point_pen.setWidth(3)
-            painter.setPen(point_pen)
-            painter.setBrush(QColor(Style.DARK_ACCENT_PRIMARY))
+            fill_path = QPainterPath()
+            fill_path.moveTo(points[0].x(), graph_bottom)
+            for point in points:
+                fill_path.lineTo(point)
+            fill_path.lineTo(points[-1].x(), graph_bottom)
+            fill_path.closeSubpath()
+            painter.drawPath(fill_path)
             
+            # Draw data points
+            painter.setPen(self._point_pen)
+            painter.setBrush(self._point_brush)
             for point in points:
                 painter.drawEllipse(point, 3, 3)
         
         # Draw time labels on X-axis
         if len(self.time_labels) > 1:
-            painter.setPen(QColor(Style.DARK_TEXT_SECONDARY))
+            painter.setPen(self._time_label_color)
             
             # Show every 5th time label to avoid crowding
             step = max(1, len(self.time_labels) // 6)
+            last_index = len(self.time_labels) - 1
             for i in range(0, len(self.time_labels), step):
-                if i < len(self.time_labels):
-                    x = graph_left + (graph_width * i / (len(self.time_labels) - 1))
-                    painter.drawText(x - 20, graph_bottom + 15, self.time_labels[i])
+                x = graph_left + (graph_width * i / last_index)
+                painter.drawText(QPointF(x - 20, graph_bottom + 15), self.time_labels[i])
     
     def closeEvent(self, event):
         """Clean up when closing."""
@@ -0,0 +1,22 @@
+# utils/clock.py
+# Description: Shared wall-clock timestamp strings, formatted at most once per second.
+
+import time
+from functools import lru_cache
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+
+
+def format_timestamp(seconds: float) -> str:
+    """Formats an epoch time as 'YYYY-MM-DD HH:MM:SS'; repeats within the same second are free."""
+    return _format_second(int(seconds))
+
+
+def now_str() -> str:
+    """The current local time as 'YYYY-MM-DD HH:MM:SS'."""
+    return _format_second(int(time.time()))
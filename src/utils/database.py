@@ -1,9 +1,53 @@
 # utils/database.py
 # Description: Manages all database operations for the application.
 
+import logging
 import os
+import queue
 import sys
 import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import Future
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceStatus(IntEnum):
+    """Status codes used when counting and comparing; the devices table keeps the label text."""
+    OFFLINE = 0
+    ONLINE = 1
+    WARNING = 2
+    UNKNOWN = 3
+
+    @property
+    def label(self) -> str:
+        return STATUS_LABELS[self]
+
+
+STATUS_LABELS = ("Offline", "Online", "Warning", "Unknown")  # indexed by DeviceStatus
+
+# Backup configurations are stored as a format byte followed by the payload.
+# Rows written before compression was introduced hold plain TEXT and are read as-is.
+CONFIG_FORMAT_ZLIB = b"\x01"
+CONFIG_COMPRESS_LEVEL = 6
+
+
+def pack_config(configuration: str) -> bytes:
+    """Compresses a configuration for storage in the backups table."""
+    return CONFIG_FORMAT_ZLIB + zlib.compress(configuration.encode("utf-8"), CONFIG_COMPRESS_LEVEL)
+
+
+def unpack_config(stored) -> str:
+    """Returns the configuration text of a backups row, whichever format it was stored in."""
+    if isinstance(stored, str):
+        return stored
+    if stored[:1] == CONFIG_FORMAT_ZLIB:
+        return zlib.decompress(stored[1:]).decode("utf-8")
+    return bytes(stored).decode("utf-8")
 
 
 class DatabaseManager:
@@ -181,6 +225,37 @@ class DatabaseManager:
         self._connection.commit()
         return cur.rowcount > 0
 
+    def update_device_statuses(self, results):
+        """Bulk status update from (device_id, status) pairs in a single transaction."""
+        cur = self._connection.cursor()
+        cur.executemany(
+            "UPDATE devices SET status=? WHERE id=?",
+            [(status, device_id) for device_id, status in results],
+        )
+        self._connection.commit()
+        return cur.rowcount
+
+    def get_device_summary(self):
+        """
+        Status counts and the number of devices backed up at least once, from a single
+        pass over the devices table. Returns (Counter({DeviceStatus.ONLINE: n, ...}), backed_up).
+        Labels are mapped to codes inside the query, so callers only compare ints.
+        """
+        cur = self._connection.cursor()
+        cur.execute(
+            """
+            SELECT CASE status WHEN 'Offline' THEN 0 WHEN 'Online' THEN 1 WHEN 'Warning' THEN 2 ELSE 3 END AS code,
+                   COUNT(*), SUM(last_backup NOT LIKE '%Never%')
+            FROM devices GROUP BY code
+            """
+        )
+        counts = Counter()
+        backed_up = 0
+        for code, count, status_backed_up in cur.fetchall():
+            counts[DeviceStatus(code)] = count
+            backed_up += status_backed_up or 0
+        return counts, backed_up
+
     # ------------------------------------------------------------------
     #  BACKUP METHODS
     # ------------------------------------------------------------------
@@ -188,11 +263,12 @@ class DatabaseManager:
         cur = self._connection.cursor()
         cur.execute(
             "INSERT INTO backups (device_id, timestamp, configuration) VALUES (?, ?, ?)",
-            (device_id, timestamp, configuration),
+            (device_id, timestamp, pack_config(configuration)),
         )
         self._connection.commit()
 
     def get_backups_for_device(self, device_id: int):
+        """Backup rows, newest first. 'configuration' is stored form; read it with unpack_config()."""
         cur = self._connection.cursor()
         cur.execute("SELECT * FROM backups WHERE device_id=? ORDER BY timestamp DESC", (device_id,))
         return [dict(r) for r in cur.fetchall()]
@@ -251,6 +327,22 @@ class DatabaseManager:
         cur.execute("SELECT * FROM application_logs ORDER BY id DESC")
         return [dict(r) for r in cur.fetchall()]
 
+    def get_log_entries(self, limit: int, before_id: int = None):
+        """
+        Returns up to `limit` log entries, newest first. Pass the id of the oldest entry
+        already loaded as `before_id` to get the next page; keying on id rather than an
+        OFFSET keeps pages stable while new entries are being written.
+        """
+        cur = self._connection.cursor()
+        if before_id is None:
+            cur.execute("SELECT * FROM application_logs ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            cur.execute(
+                "SELECT * FROM application_logs WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (before_id, limit),
+            )
+        return [dict(r) for r in cur.fetchall()]
+
     def clear_all_log_entries(self):
         cur = self._connection.cursor()
         cur.execute("DELETE FROM application_logs")
@@ -260,3 +352,100 @@ class DatabaseManager:
 
 # Singleton instance for use across the application
 db_manager = DatabaseManager()
+
+
+class BackupWriter(threading.Thread):
+    """
+    Single writer thread for backup rows. SSH workers `enqueue` a finished backup and get
+    a Future that completes once the row is committed; rows are inserted in batches of up
+    to BATCH_SIZE, or whatever arrived within FLUSH_INTERVAL of the first one, so one commit
+    covers many backups. The thread writes through its own connection rather than sharing
+    the DatabaseManager one with the GUI thread.
+    The thread starts on the first enqueue; `stop` writes anything still queued, and rows
+    enqueued after it fail straight away.
+    """
+
+    BATCH_SIZE = 32
+    FLUSH_INTERVAL = 0.5  # seconds
+
+    def __init__(self, db_path: str):
+        super().__init__(name="BackupWriter", daemon=True)
+        self._db_path = db_path
+        self._connection = None  # opened on the writer thread by the first write
+        self._queue = queue.Queue()
+        self._start_lock = threading.Lock()
+        self._stopped = False
+
+    def enqueue(self, device_id: int, timestamp: str, configuration: str) -> Future:
+        """Queues a backup row; the returned Future fails with the sqlite3 error if it is not saved."""
+        done = Future()
+        with self._start_lock:
+            if self._stopped:
+                done.set_exception(RuntimeError("the backup writer has been stopped"))
+                return done
+            self._queue.put((device_id, timestamp, configuration, done))
+            if self.ident is None:
+                self.start()
+        return done
+
+    def stop(self, timeout: float = 5.0):
+        """Flushes pending rows and waits for the writer to exit."""
+        with self._start_lock:
+            self._stopped = True
+            if self.ident is None:
+                return
+            self._queue.put(None)
+        self.join(timeout)
+
+    def run(self):
+        try:
+            self._drain()
+        finally:
+            if self._connection is not None:
+                self._connection.close()
+
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch):
+        """Inserts the batch in a single transaction, then completes each row's Future."""
+        try:
+            if self._connection is None:
+                self._connection = sqlite3.connect(self._db_path)
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO backups (device_id, timestamp, configuration) VALUES (?, ?, ?)",
+                    [(device_id, timestamp, pack_config(configuration))
+                     for device_id, timestamp, configuration, _ in batch],
+                )
+        except sqlite3.Error as e:
+            logger.error("Failed to save %d backup(s): %s", len(batch), e)
+            for *_, done in batch:
+                done.set_exception(e)
+            return
+        for *_, done in batch:
+            done.set_result(None)
+
+
+backup_writer = BackupWriter(DatabaseManager.get_database_path())
@@ -1,9 +1,9 @@
 # utils/logger.py
 import logging
 from PySide6.QtCore import QObject, Signal
-from datetime import datetime
 import sys # Make sure sys is imported
 
+from utils.clock import format_timestamp
 from utils.database import db_manager
 
 class QtLogHandler(logging.Handler, QObject):
@@ -15,7 +15,7 @@ class QtLogHandler(logging.Handler, QObject):
         self.database_log_level = logging.INFO 
 
     def emit(self, record):
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = format_timestamp(record.created)
         msg = self.format(record)
 
         self.new_log_record.emit(record.levelname, timestamp, msg)
@@ -48,6 +48,8 @@ class AppLogger:
             console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
             console_handler.setLevel(logging.DEBUG) # Set to DEBUG to see all messages
             cls._logger.addHandler(console_handler)
+            # This logger has its own console handler; don't also echo through the root logger.
+            cls._logger.propagate = False
             # --- END ENSURE ---
 
         return cls._instance